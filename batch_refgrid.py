@@ -0,0 +1,95 @@
+import argparse
+import glob
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from execute_refgrid import RefGrid, parse_pipeline, run_pipeline, validate_patterns
+
+
+def find_refgrids(paths: list[str]) -> list[str]:
+    """
+    Expands each path, which may be a directory (all of its .refgrid files), a glob
+    pattern or a single file, into a list of RefGrid files in a stable order.
+    """
+    files = []
+
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "*.refgrid"))))
+        elif glob.has_magic(path):
+            files.extend(sorted(glob.glob(path)))
+        else:
+            files.append(path)
+
+    return files
+
+
+def run_file(input_file: str, steps: list[tuple]) -> dict:
+    """
+    Runs a pipeline over one RefGrid file in a worker process and returns a report
+    holding its output and how long it took. Any error is reported with its type
+    rather than raised, so one bad file can't end the batch.
+    """
+    out = io.StringIO()
+    start = time.perf_counter()
+
+    try:
+        run_pipeline(RefGrid(), input_file, steps, out)
+        error = None
+    except Exception as e:
+        error = e
+
+    report = {
+        "refgrid": input_file,
+        "seconds": time.perf_counter() - start,
+        "output": out.getvalue(),
+    }
+    if error is not None:
+        report["error"] = str(error)
+        report["error_type"] = type(error).__name__
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="COMP3506/7505 Assignment One: DNA-RefGrid batch runner"
+    )
+    parser.add_argument(
+        "refgrids",
+        type=str,
+        nargs="+",
+        help="RefGrid files, directories of them, or glob patterns.",
+    )
+    parser.add_argument(
+        "--pipeline",
+        type=str,
+        required=True,
+        help="Operations to run on each file, as for execute_refgrid.py --pipeline "
+        "(eg: --pipeline reverse:3,check-clone).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes (default: one per CPU).",
+    )
+    args = parser.parse_args()
+
+    try:
+        steps = parse_pipeline(args.pipeline)
+    except ValueError as e:
+        parser.error(str(e))
+    for step in steps:
+        if step[0] == "splice" and not validate_patterns(step[1], step[2]):
+            sys.exit(-1)
+
+    files = find_refgrids(args.refgrids)
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        # map yields in submission order, as soon as each next result is ready
+        for report in executor.map(run_file, files, [steps] * len(files)):
+            print(json.dumps(report), flush=True)
@@ -0,0 +1,173 @@
+import argparse
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Optional
+
+from generate_refgrid import generate
+
+OPERATIONS: dict[str, list[str]] = {
+    "reverse": ["--reverse-k", "{middle}"],
+    "splice": ["--cut-and-splice", "gta:atc"],
+    "check-clone": ["--check-clone"],
+}
+"""The execute_refgrid.py arguments for each operation. {middle} is the middle row."""
+
+
+def run_once(arguments: list[str]) -> tuple[float, int]:
+    """
+    Runs execute_refgrid.py with the given arguments in a child process and returns
+    its wall time in seconds and its peak resident memory in KiB. If it fails,
+    raises a `RuntimeError`.
+    """
+    command = [sys.executable, "execute_refgrid.py", *arguments]
+    start = time.perf_counter()
+    child = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    _, status, usage = os.wait4(child.pid, 0)  # the child's own rusage
+    seconds = time.perf_counter() - start
+    child.returncode = os.waitstatus_to_exitcode(status)
+
+    if child.returncode != 0:
+        raise RuntimeError(f"{' '.join(command)} exited with {child.returncode}")
+    return seconds, usage.ru_maxrss
+
+
+def fit_exponent(sizes: list[int], values: list[float]) -> Optional[float]:
+    """
+    Returns the slope of the least-squares line through (log size, log value), the
+    exponent k of value ~ size^k. Linear paths fit about 1 and quadratic ones 2.
+    Values at or below zero (lost in noise) are left out; if fewer than two sizes
+    remain, returns `None`.
+    """
+    points = [(size, value) for size, value in zip(sizes, values) if value > 0]
+    if len(points) < 2:
+        return None
+
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(value) for _, value in points]
+    mean_x = statistics.fmean(xs)
+    mean_y = statistics.fmean(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def rounded(exponent: Optional[float]) -> Optional[float]:
+    """Rounds a fitted exponent to two places, keeping `None`."""
+    return None if exponent is None else round(exponent, 2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="COMP3506/7505 Assignment One: DNA-RefGrid scaling benchmark"
+    )
+    parser.add_argument(
+        "--rows",
+        type=str,
+        default="500,1000,2000,4000",
+        help="Comma-separated row counts to sweep.",
+    )
+    parser.add_argument(
+        "--len", type=int, default=100, help="The length of each row (default: 100)."
+    )
+    parser.add_argument(
+        "--operations",
+        type=str,
+        default=",".join(OPERATIONS),
+        help="Comma-separated operations to run: " + ", ".join(OPERATIONS) + ".",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="Runs per operation and size; the median time is reported.",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed.")
+    parser.add_argument(
+        "--viable",
+        choices=["yes", "no", "any"],
+        default="yes",
+        help="Generate grids that are (or are not) viable for cloning.",
+    )
+    parser.add_argument(
+        "--density",
+        type=float,
+        default=0.02,
+        help="Probability of planting the splice pattern (gta) at each position.",
+    )
+    args, extra = parser.parse_known_args()  # the rest goes to execute_refgrid.py
+
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+    row_counts = [int(rows) for rows in args.rows.split(",")]
+    operations = args.operations.split(",")
+    for operation in operations:
+        if operation not in OPERATIONS:
+            parser.error(f"Unknown operation: {operation!r}")
+
+    runs = []
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in [1, *row_counts]:  # one row measures interpreter start-up
+            path = os.path.join(directory, f"{rows}x{args.len}.refgrid")
+            grid = generate(
+                rows,
+                args.len,
+                args.seed,
+                pattern="gta",
+                density=args.density,
+                viable={"yes": True, "no": False, "any": None}[args.viable],
+            )
+            with open(path, "w") as f:
+                f.writelines(row + "\n" for row in grid)
+
+            for operation in operations:
+                arguments = [
+                    argument.format(middle=rows // 2)
+                    for argument in OPERATIONS[operation]
+                ]
+                samples = [
+                    run_once(["--refgrid", path, *arguments, *extra])
+                    for _ in range(args.repeats)
+                ]
+                runs.append(
+                    {
+                        "operation": operation,
+                        "rows": rows,
+                        "len": args.len,
+                        "cells": rows * args.len,
+                        "seconds": statistics.median(s for s, _ in samples),
+                        "peak_kib": max(m for _, m in samples),
+                    }
+                )
+                print(
+                    f"{operation:12} {rows:8} x {args.len:<6} "
+                    f"{runs[-1]['seconds']:9.3f} s {runs[-1]['peak_kib']:10} KiB",
+                    file=sys.stderr,
+                )
+
+    # fit what each size adds over start-up, or the fixed cost flattens the slope
+    fits = {}
+    for operation in operations:
+        base, *mine = [run for run in runs if run["operation"] == operation]
+        cells = [run["cells"] for run in mine]
+        seconds = [run["seconds"] - base["seconds"] for run in mine]
+        memory = [run["peak_kib"] - base["peak_kib"] for run in mine]
+        fits[operation] = {
+            "baseline_seconds": base["seconds"],
+            "baseline_peak_kib": base["peak_kib"],
+            "time_exponent": rounded(fit_exponent(cells, seconds)),
+            "memory_exponent": rounded(fit_exponent(cells, memory)),
+        }
+        print(
+            f"{operation:12} time ~ cells^{fits[operation]['time_exponent']}, "
+            f"memory ~ cells^{fits[operation]['memory_exponent']}",
+            file=sys.stderr,
+        )
+
+    print(json.dumps({"runs": runs, "fits": fits}, indent=2))
@@ -0,0 +1,279 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable
+
+from structures.m_extensible_list import ExtensibleList
+from structures.m_single_linked_list import SingleLinkedList, SingleNode
+from structures.m_stack import EStack, IStack, LStack
+
+Setup = Callable[[int], Any]
+"""Builds the state a benchmark runs on for a size n. Not timed."""
+
+Run = Callable[[Any, int], int]
+"""Runs a benchmark on its state for a size n and returns the operations done."""
+
+
+def filled_extlist(n: int) -> ExtensibleList:
+    """Returns an extensible list holding 1 to n."""
+    my_list = ExtensibleList()
+    my_list.extend(range(1, n + 1))  # no zeros: remove_at treats them as missing
+    return my_list
+
+
+def filled_linkedlist(n: int) -> SingleLinkedList:
+    """Returns a linked list holding 1 to n."""
+    my_list = SingleLinkedList()
+    for i in range(1, n + 1):
+        my_list.insert_to_back(SingleNode(i))
+    return my_list
+
+
+def run_extlist_append(my_list: ExtensibleList, n: int) -> int:
+    """Appends n elements."""
+    for i in range(1, n + 1):
+        my_list.append(i)
+    return n
+
+
+def run_extlist_get_at(my_list: ExtensibleList, n: int) -> int:
+    """Reads every element."""
+    for i in range(n):
+        my_list.get_at(i)
+    return n
+
+
+def run_extlist_set_at(my_list: ExtensibleList, n: int) -> int:
+    """Writes every element."""
+    for i in range(n):
+        my_list.set_at(i, i + 1)
+    return n
+
+
+def run_extlist_remove_at(my_list: ExtensibleList, n: int) -> int:
+    """Removes every element, from the back."""
+    for i in range(n - 1, -1, -1):
+        my_list.remove_at(i)
+    return n
+
+
+def run_extlist_resize(my_list: ExtensibleList, n: int) -> int:
+    """Grows the capacity to 2n."""
+    my_list.reserve(2 * n)  # one reallocation copying n elements
+    return n
+
+
+def run_linkedlist_insert_front(my_list: SingleLinkedList, n: int) -> int:
+    """Inserts n nodes at the front."""
+    for i in range(n):
+        my_list.insert_to_front(SingleNode(i))
+    return n
+
+
+def run_linkedlist_insert_back(my_list: SingleLinkedList, n: int) -> int:
+    """Inserts n nodes at the back."""
+    for i in range(n):
+        my_list.insert_to_back(SingleNode(i))
+    return n
+
+
+def run_linkedlist_remove_front(my_list: SingleLinkedList, n: int) -> int:
+    """Removes every node from the front."""
+    for _ in range(n):
+        my_list.remove_from_front()
+    return n
+
+
+def run_linkedlist_remove_back(my_list: SingleLinkedList, n: int) -> int:
+    """Removes up to 100 nodes from the back."""
+    # each removal walks the list, so only a fixed number are timed
+    count = min(n, 100)
+    for _ in range(count):
+        my_list.remove_from_back()
+    return count
+
+
+def run_linkedlist_find(my_list: SingleLinkedList, n: int) -> int:
+    """Finds the last element ten times."""
+    count = 10
+    for _ in range(count):
+        my_list.find_element(n)  # the last element, a full walk
+    return count
+
+
+def run_linkedlist_reverse(my_list: SingleLinkedList, n: int) -> int:
+    """Reverses the list."""
+    my_list.reverse()
+    return n
+
+
+def run_stack_push_pop(my_stack: EStack | LStack | IStack, n: int) -> int:
+    """Pushes n elements, then pops them all."""
+    for i in range(1, n + 1):
+        my_stack.push(i)
+    while not my_stack.empty():
+        my_stack.pop()
+    return 2 * n
+
+
+BENCHMARKS: dict[str, tuple[Setup, Run]] = {
+    "extlist.append": (lambda n: ExtensibleList(), run_extlist_append),
+    "extlist.get_at": (filled_extlist, run_extlist_get_at),
+    "extlist.set_at": (filled_extlist, run_extlist_set_at),
+    "extlist.remove_at": (filled_extlist, run_extlist_remove_at),
+    "extlist.resize": (filled_extlist, run_extlist_resize),
+    "linkedlist.insert_to_front": (
+        lambda n: SingleLinkedList(),
+        run_linkedlist_insert_front,
+    ),
+    "linkedlist.insert_to_back": (
+        lambda n: SingleLinkedList(),
+        run_linkedlist_insert_back,
+    ),
+    "linkedlist.remove_from_front": (filled_linkedlist, run_linkedlist_remove_front),
+    "linkedlist.remove_from_back": (filled_linkedlist, run_linkedlist_remove_back),
+    "linkedlist.find_element": (filled_linkedlist, run_linkedlist_find),
+    "linkedlist.reverse": (filled_linkedlist, run_linkedlist_reverse),
+    "estack.push_pop": (lambda n: EStack(), run_stack_push_pop),
+    "lstack.push_pop": (lambda n: LStack(), run_stack_push_pop),
+    "istack.push_pop": (lambda n: IStack(), run_stack_push_pop),
+}
+"""Each benchmark's setup and run functions, by name."""
+
+
+def measure(setup: Setup, run: Run, n: int, repeats: int, warmup: int) -> dict:
+    """
+    Times a benchmark for size n, repeats times after warmup untimed runs, on fresh
+    state each time. Returns the median, quartiles and IQR in ns per operation.
+    """
+    samples = []
+
+    for i in range(warmup + repeats):
+        state = setup(n)
+        start = time.perf_counter_ns()
+        ops = run(state, n)
+        elapsed = time.perf_counter_ns() - start
+        if i >= warmup:
+            samples.append(elapsed / max(ops, 1))
+
+    if len(samples) > 1:
+        q1, median, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    else:
+        q1 = median = q3 = samples[0]
+
+    return {
+        "ops": ops,
+        "median_ns": median,
+        "q1_ns": q1,
+        "q3_ns": q3,
+        "iqr_ns": q3 - q1,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Prints each benchmark's median against the baseline's and returns the names of
+    those that got slower by more than threshold (a fraction, e.g. 0.1 for 10%).
+    """
+    regressions = []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["median_ns"] / max(baseline[name]["median_ns"], 1e-9)
+        regressed = ratio > 1 + threshold
+        print(
+            f"{name:40} {baseline[name]['median_ns']:12.1f} -> "
+            f"{result['median_ns']:12.1f} ns/op  x{ratio:.2f}"
+            + ("  REGRESSION" if regressed else ""),
+            file=sys.stderr,
+        )
+        if regressed:
+            regressions.append(name)
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="COMP3506/7505 Assignment One: Data Structure Benchmarks"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=str,
+        default="1000,10000,100000",
+        help="Comma-separated sizes to run each benchmark at.",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=7,
+        help="Timed runs per benchmark and size.",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="Untimed runs before the timed ones.",
+    )
+    parser.add_argument(
+        "--only",
+        type=str,
+        help="Only run benchmarks whose names start with this prefix (eg: extlist).",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="Write the JSON results to this file instead of stdout.",
+    )
+    parser.add_argument(
+        "--compare",
+        type=str,
+        help="A saved JSON result to compare against. Exits non-zero on regressions.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="How much slower a median may get before it is a regression "
+        "(default: 0.1, i.e. 10%%).",
+    )
+    args = parser.parse_args()
+
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    results = {}
+    for name, (setup, run) in BENCHMARKS.items():
+        if args.only is not None and not name.startswith(args.only):
+            continue
+        for n in sizes:
+            results[f"{name}/{n}"] = measure(setup, run, n, args.repeats, args.warmup)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "sizes": sizes,
+            "repeats": args.repeats,
+            "warmup": args.warmup,
+        },
+        "results": results,
+    }
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if len(regressions) > 0:
+            print(f"{len(regressions)} benchmark(s) regressed", file=sys.stderr)
+            sys.exit(1)
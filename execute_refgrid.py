@@ -1,9 +1,47 @@
 import argparse
+import atexit
+import cProfile
+import io
+import json
+import mmap
+import os
+import pstats
+import struct
 import sys
+import time
+import tracemalloc
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Callable, Iterable, Iterator, Optional
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; is_viable_numpy falls back without it
+    np = None
+
+from structures.m_aho_corasick import AhoCorasick
 from structures.m_extensible_list import ExtensibleList
-from structures.m_single_linked_list import SingleLinkedList, SingleNode
-from structures.m_stack import EStack, LStack
+from structures.m_packed_list import PackedList
+from structures.m_reachability_index import ReachabilityIndex
+from structures.m_single_linked_list import NodePool, SingleLinkedList, SingleNode
+from structures.m_stats import STATS
+from structures.m_unrolled_linked_list import UnrolledLinkedList, UnrolledNode
+
+CACHE_SUFFIX: str = ".bin"
+"""The suffix added to a RefGrid file's path to name its binary cache."""
+
+CACHE_MAGIC: bytes = b"RGRD"
+"""The first bytes of every RefGrid cache file."""
+
+CACHE_VERSION: int = 1
+"""The version of the cache format, bumped whenever the layout changes."""
+
+_CACHE_HEADER: struct.Struct = struct.Struct("<4sHQQIqQ")
+"""
+The cache header: magic, version, rows, len, CRC-32 of the packed bases, and the
+source file's mtime (in ns) and size. The 2-bit packed bases follow it.
+"""
 
 
 class RefGrid:
@@ -19,12 +57,45 @@ class RefGrid:
         function is called.
         """
 
-        self.linkedlist: SingleLinkedList = SingleLinkedList()
-        """The linked list representation of the RefGrid."""
+        self.linkedlist: SingleLinkedList = SingleLinkedList(NodePool())
+        """
+        The linked list representation of the RefGrid. Its pool recycles the nodes
+        dropped by `cut_and_splice`.
+        """
 
         self.extlist: ExtensibleList = ExtensibleList()
         """The extensible list representation of the RefGrid."""
 
+        self.packed: PackedList = PackedList()
+        """The 2-bit packed representation of the RefGrid."""
+
+        self.unrolled: UnrolledLinkedList = UnrolledLinkedList()
+        """
+        The unrolled linked list representation of the RefGrid. Every row starts in a
+        new block, so row operations only relink and rewrite that row's blocks.
+        """
+
+        self.row_lengths: ExtensibleList = ExtensibleList()
+        """The length of each row once the RefGrid has been cut and spliced."""
+
+        self.row_index: ExtensibleList = ExtensibleList()
+        """
+        The node before the first node of each row of the linked list, or None for the
+        first row. Row k starts at `row_index[k].get_next()`, or at the head.
+        """
+
+        self.reachability: Optional[ReachabilityIndex] = None
+        """
+        The precomputed index behind `is_viable_between`, built from the extensible
+        list by `build_reachability_index`.
+        """
+
+        self.mapping: Optional[mmap.mmap] = None
+        """A copy-on-write memory map of the RefGrid file, read lazily."""
+
+        self.stride: int = 0
+        """The number of bytes per row in `mapping`, including the line ending."""
+
         self.rows: int = 0
         """The number of rows in the RefGrid."""
 
@@ -32,104 +103,460 @@ class RefGrid:
         """The length of each row in the RefGrid."""
 
     def read_to_linkedlist(self, input_file: str) -> None:
-        """Reads a RefGrid file into the linked list."""
+        """
+        Reads a RefGrid file into the linked list in a single forward pass, recording
+        the node before each row in the row index.
+        """
         with open(input_file) as f:
             first = True
             for line in f:
                 self.rows += 1
+                self.row_index.append(self.linkedlist.get_tail())
                 for character in line.strip():
-                    self.linkedlist.insert_to_front(SingleNode(character))
+                    self.linkedlist.insert_to_back(self.linkedlist.new_node(character))
                     if first:
                         self.len += 1
                 first = False
 
-        self.linkedlist.reverse()
-
     def read_to_extlist(self, input_file: str) -> None:
-        """Reads a RefGrid file into the extensible list."""
+        """
+        Reads a RefGrid file into the extensible list, one row per copy. The list's
+        capacity is reserved up front from the file size and the first row's length.
+        """
+        with open(input_file, "rb") as f:
+            first = f.readline()
+            if len(first) > 0:
+                rows = -(-os.fstat(f.fileno()).st_size // len(first))
+                self.extlist.reserve(rows * len(first.strip()))
+            f.seek(0)
+
+            for line in f:
+                row = line.strip()
+                if self.rows == 0:
+                    self.len = len(row)
+                self.rows += 1
+                self.extlist.extend_from_buffer(row)
+
+    def read_to_packed(self, input_file: str) -> None:
+        """Reads a RefGrid file into the packed list."""
         with open(input_file) as f:
-            first = True
             for line in f:
+                row = line.strip()
+                if self.rows == 0:
+                    self.len = len(row)
                 self.rows += 1
-                for character in line.strip():
-                    self.extlist.append(character)
-                    if first:
-                        self.len += 1
-                first = False
+                self.packed.extend(row)
 
-    def stringify_linkedlist(self) -> str:
-        """Converts the linked list to a string."""
+    def read_to_unrolled(self, input_file: str) -> None:
+        """Reads a RefGrid file into the unrolled linked list, one block per chunk."""
+        capacity = self.unrolled.get_capacity()
+        with open(input_file) as f:
+            for line in f:
+                row = line.strip()
+                if self.rows == 0:
+                    self.len = len(row)
+                self.rows += 1
+                for i in range(0, len(row), capacity):
+                    block = UnrolledNode(list(row[i : i + capacity]))
+                    self.unrolled.insert_block_after(self.unrolled.get_tail(), block)
+
+    def read_to_mmap(self, input_file: str) -> None:
+        """
+        Maps a RefGrid file into memory without reading it. The row boundaries are
+        found from the first line ending and the file size, so only the pages that
+        later operations touch are ever read. Rows of uneven length are only detected
+        when they change the file size or shorten the last row. An empty file is not
+        mapped and has no rows.
+        """
+        with open(input_file, "rb") as f:
+            size = f.seek(0, 2)
+            if size == 0:  # mmap can't map an empty file
+                self.mapping = None
+                self.rows = self.len = self.stride = 0
+                return
+            self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        self.len = self.mapping.find(b"\n")
+        if self.len == -1:  # a single row with no line ending
+            self.len = size
+        newline = 2 if self.len > 0 and self.mapping[self.len - 1] == ord("\r") else 1
+        self.len -= newline - 1
+        self.stride = self.len + newline
+        self.rows = (size + newline) // self.stride
+
+        if size not in (self.rows * self.stride, self.rows * self.stride - newline):
+            raise ValueError(f"{input_file} has rows of different lengths")
+        if size == self.rows * self.stride - newline:  # no line ending at the end
+            if self.len == 0:  # only line endings, so the last "row" is the end
+                self.rows -= 1
+            elif self.mapping[size - 1] == ord("\n"):  # a short last row
+                raise ValueError(f"{input_file} has rows of different lengths")
 
-        outstr = ""
-        counter = 0
-        current = self.linkedlist.get_head()
+    def read_parallel(self, input_file: str, workers: int) -> None:
+        """
+        Reads a RefGrid file into the packed list on a pool of worker processes.
+
+        The file is split into byte ranges that end on line endings, and each worker
+        checks its range's rows for length and alphabet and packs them (see
+        `_parse_chunk`). The packed runs are then appended in file order, a whole run
+        at a time. If the rows differ in length or hold anything but a, c, g and t,
+        raises a `ValueError`.
+        """
+        bounds = _chunk_bounds(input_file, workers * 4)
 
-        while current != None:
-            outstr += str(current.get_data())
-            counter += 1
-            if counter % self.len == 0:
-                outstr += "\n"
-            current = current.get_next()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(
+                _parse_chunk,
+                [input_file] * (len(bounds) - 1),
+                bounds[:-1],
+                bounds[1:],
+            )
 
-        return outstr
+            for data, rows, length in chunks:
+                if rows == 0:
+                    continue
+                if self.rows == 0:
+                    self.len = length
+                elif length != self.len:
+                    raise ValueError(f"{input_file} has rows of different lengths")
+
+                self.packed.extend_packed(data, rows * length)
+                self.rows += rows
+
+    def read_cached(self, input_file: str, form: str, workers: int = 1) -> None:
+        """
+        Reads a RefGrid file into the given form ("linkedlist", "extlist", "packed" or
+        "unrolled") through its binary cache, the file's path plus `CACHE_SUFFIX`.
+
+        If the cache matches the file's mtime and size and its checksum holds, the
+        packed bases are taken from it in a single read. Otherwise the file is parsed
+        (on workers processes if more than one) and the cache is rewritten; a cache
+        that can't be written is skipped. Other forms are then filled from the packed
+        list, one row at a time.
+        """
+        source = os.stat(input_file)
+        if not self.__read_cache(input_file + CACHE_SUFFIX, source):
+            if workers > 1:
+                self.read_parallel(input_file, workers)
+            else:
+                self.read_to_packed(input_file)
+            self.__write_cache(input_file + CACHE_SUFFIX, source)
+
+        if form == "packed":
+            return
+
+        capacity = self.unrolled.get_capacity()
+        if form == "extlist":
+            self.extlist.reserve(self.rows * self.len)
+        for row in self.iter_packed_rows():
+            if form == "extlist":
+                self.extlist.extend(row)
+            elif form == "unrolled":
+                for i in range(0, len(row), capacity):
+                    block = UnrolledNode(list(row[i : i + capacity]))
+                    self.unrolled.insert_block_after(self.unrolled.get_tail(), block)
+            else:
+                self.row_index.append(self.linkedlist.get_tail())
+                for character in row:
+                    self.linkedlist.insert_to_back(self.linkedlist.new_node(character))
+        self.packed.reset()
+
+    def __read_cache(self, cache_file: str, source: os.stat_result) -> bool:
+        """
+        Loads the packed list from a cache file and returns True, or returns False if
+        the cache is missing, malformed, corrupt or older than the source.
+        """
+        try:
+            with open(cache_file, "rb") as f:
+                cache = f.read()
+        except OSError:
+            return False
+
+        if len(cache) < _CACHE_HEADER.size:
+            return False
+        magic, version, rows, length, crc, mtime_ns, size = _CACHE_HEADER.unpack_from(
+            cache
+        )
+        data = memoryview(cache)[_CACHE_HEADER.size :]
+        if (
+            magic != CACHE_MAGIC
+            or version != CACHE_VERSION
+            or mtime_ns != source.st_mtime_ns
+            or size != source.st_size
+            or len(data) != (rows * length + 3) >> 2
+            or zlib.crc32(data) != crc
+        ):
+            return False
+
+        self.packed.extend_packed(data, rows * length)
+        self.rows = rows
+        self.len = length
+        return True
+
+    def __write_cache(self, cache_file: str, source: os.stat_result) -> None:
+        """
+        Writes the packed list to a cache file for the given source, replacing any
+        old cache atomically. If the cache can't be written, does nothing.
+        """
+        data = self.packed.to_bytes()
+        header = _CACHE_HEADER.pack(
+            CACHE_MAGIC,
+            CACHE_VERSION,
+            self.rows,
+            self.len,
+            zlib.crc32(data),
+            source.st_mtime_ns,
+            source.st_size,
+        )
+
+        try:
+            with open(cache_file + ".tmp", "wb") as f:
+                f.write(header)
+                f.write(data)
+            os.replace(cache_file + ".tmp", cache_file)
+        except OSError:
+            pass
+
+    def _mmap_offset(self, idx: int) -> int:
+        """Returns the offset into `mapping` of the base at grid index idx."""
+        return idx // self.len * self.stride + idx % self.len
+
+    def row_length(self, k: int) -> int:
+        """Returns the length of row k, which varies once the RefGrid is spliced."""
+        if self.row_lengths.get_size() == self.rows:
+            return self.row_lengths.get_at(k)
+        return self.len
+
+    def _track_row_lengths(self) -> None:
+        """Starts recording row lengths, ahead of the first splice."""
+        if self.row_lengths.get_size() != self.rows:
+            self.row_lengths.reset()
+            for _ in range(self.rows):
+                self.row_lengths.append(self.len)
+
+    def _untrack_row_lengths(self) -> None:
+        """
+        Stops recording row lengths if every row has the same length again, making
+        that the RefGrid's `len`. If the rows differ, raises a `ValueError`.
+        """
+        if self.row_lengths.get_size() != self.rows:
+            return
+
+        lengths = self.row_lengths
+        if any(length != lengths[0] for length in lengths):
+            raise ValueError("the rows of the RefGrid have different lengths")
+
+        self.len = lengths[0] if self.rows > 0 else 0
+        self.row_lengths.reset()
+
+    def get_row_start(self, k: int) -> Optional[SingleNode]:
+        """
+        Returns the first node of row k of the linked list in constant time. If k is
+        outside the RefGrid, returns `None`.
+        """
+        if k < 0 or k >= self.rows:
+            return None
+
+        before = self.row_index.get_at(k)
+        return self.linkedlist.get_head() if before is None else before.get_next()
+
+    def get_row(self, k: int) -> Optional[str]:
+        """
+        Returns row k of the linked list, visiting only that row's nodes. If k is
+        outside the RefGrid, returns `None`.
+        """
+        if k < 0 or k >= self.rows:
+            return None
+        return next(self.iter_rows(k, k + 1))
+
+    def iter_rows(self, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """
+        Yields rows start to stop - 1 of the linked list, jumping straight to each row
+        through the row index and visiting only the nodes of the rows yielded.
+        """
+        start = max(start, 0)
+        stop = self.rows if stop is None else min(stop, self.rows)
+
+        for k in range(start, stop):
+            yield "".join(
+                self.linkedlist.view(self.get_row_start(k), self.row_length(k))
+            )
+
+    def linkedlist_to_extlist(self) -> None:
+        """
+        Copies the linked list into the extensible list, one row per copy. If the rows
+        no longer have the same length, raises a `ValueError`.
+        """
+        self._untrack_row_lengths()
+        self.extlist.reset()
+        self.extlist.reserve(self.rows * self.len)
+
+        for row in self.iter_rows():
+            self.extlist.extend(row)
+
+    def extlist_to_linkedlist(self) -> None:
+        """
+        Rebuilds the linked list and its row index from the extensible list, recycling
+        the old list's nodes.
+        """
+        self.linkedlist.traverse_and_delete()
+        self.row_index.reset()
+        self.row_lengths.reset()
+
+        for row in self.iter_extlist_rows():
+            self.row_index.append(self.linkedlist.get_tail())
+            for character in row:
+                self.linkedlist.insert_to_back(self.linkedlist.new_node(character))
+
+    def _unrolled_row_blocks(
+        self, before: UnrolledNode | None, length: int
+    ) -> list[UnrolledNode]:
+        """
+        Returns the unrolled list nodes holding the row of length after before. If the
+        list ends first (e.g. at an empty last row), returns the nodes up to its end.
+        """
+        blocks = []
+        total = 0
+        node = self.unrolled.get_head() if before is None else before.get_next()
+
+        while total < length and node is not None:
+            blocks.append(node)
+            total += len(node.get_data())
+            node = node.get_next()
+
+        return blocks
+
+    def iter_extlist_rows(self) -> Iterator[str]:
+        """Yields the rows of the extensible list."""
+        for k in range(self.rows):
+            start = k * self.len
+            yield "".join(self.extlist.get_slice(start, start + self.len))
+
+    def iter_unrolled_rows(self) -> Iterator[str]:
+        """Yields the rows of the unrolled linked list."""
+        before = None
+
+        for k in range(self.rows):
+            blocks = self._unrolled_row_blocks(before, self.row_length(k))
+            yield "".join(["".join(block.get_data()) for block in blocks])
+            if len(blocks) > 0:
+                before = blocks[-1]
+
+    def iter_packed_rows(self) -> Iterator[str]:
+        """Yields the rows of the packed list."""
+        start = 0
+
+        for k in range(self.rows):
+            end = start + self.row_length(k)
+            yield self.packed.to_string(start, end)
+            start = end
+
+    def iter_mmap_rows(self) -> Iterator[str]:
+        """Yields the rows of the memory-mapped RefGrid."""
+        for k in range(self.rows):
+            start = k * self.stride
+            yield self.mapping[start : start + self.len].decode()
+
+    def stringify_linkedlist(self) -> str:
+        """Converts the linked list to a string."""
+        return "".join(row + "\n" for row in self.iter_rows())
+
+    def stringify_unrolled(self) -> str:
+        """Converts the unrolled linked list to a string."""
+        return "".join(row + "\n" for row in self.iter_unrolled_rows())
 
     def stringify_extlist(self) -> str:
         """Converts the extensible list to a string."""
         return str(self.extlist)
 
+    def stringify_packed(self) -> str:
+        """Converts the packed list to a string."""
+        return "".join(row + "\n" for row in self.iter_packed_rows())
+
+    def stringify_mmap(self) -> str:
+        """Converts the memory-mapped RefGrid to a string."""
+        return "".join(row + "\n" for row in self.iter_mmap_rows())
+
     def stringify_spliced_linkedlist(self) -> str:
         """
         Converts a cut-and-spliced linked list by handling the variable row length of
         each sequence.
         """
-        outstr = ""
-        counter = 0
-        row = 0
-        end = self.extlist.get_at(row)
-        current = self.linkedlist.get_head()
-
-        while current != None:
-            outstr += str(current.get_data())
-            counter += 1
-            if counter == end:
-                outstr += "\n"
-                row += 1
-                if row < self.rows:
-                    end += self.extlist.get_at(row)
-            current = current.get_next()
+        return self.stringify_linkedlist()
+
+    def stringify_spliced_packed(self) -> str:
+        """
+        Converts a cut-and-spliced packed list by handling the variable row length of
+        each sequence.
+        """
+        return self.stringify_packed()
 
-        return outstr
+    def stringify_spliced_unrolled(self) -> str:
+        """
+        Converts a cut-and-spliced unrolled linked list by handling the variable row
+        length of each sequence.
+        """
+        return self.stringify_unrolled()
 
     def reverse_seq(self, k):
         """
         Task 2.1, sequence reversal. You need to use/store your result in the
         linkedlist class member.
+
+        The row index gives the node before row k, and the row's nodes are relinked
+        in place, so only the nodes of row k are visited.
         """
-        new_list = SingleLinkedList()
+        if k < 0 or k >= self.rows:  # no such row
+            return
 
-        for _ in range(k * self.len):
-            new_list.insert_to_front(self.linkedlist.remove_from_front())
+        before = self.row_index.get_at(k)
+        first = self.get_row_start(k)
+        self.linkedlist.reverse_after(before, self.row_length(k))
 
-        stack = EStack()
-        for _ in range(k * self.len, (k + 1) * self.len):
-            stack.push(self.linkedlist.remove_from_front())
+        # the first node of row k is now its last, so it precedes row k + 1
+        self.row_index.set_at(k + 1, first)
 
-        while not stack.is_empty():
-            new_list.insert_to_front(stack.pop())
+    def reverse_seq_packed(self, k: int) -> None:
+        """Reverses the k-th sequence of the packed list in place."""
+        self.packed.reverse_range(k * self.len, (k + 1) * self.len)
 
-        for _ in range((k + 1) * self.len, self.rows * self.len):
-            new_list.insert_to_front(self.linkedlist.remove_from_front())
+    def reverse_seq_unrolled(self, k: int) -> None:
+        """
+        Reverses the k-th sequence of the unrolled linked list by relinking that row's
+        blocks in reverse order and reversing each block in place.
+        """
+        if k < 0 or k >= self.rows:  # no such row
+            return
+
+        before = None
+        for _ in range(k):
+            blocks = self._unrolled_row_blocks(before, self.len)
+            if len(blocks) > 0:
+                before = blocks[-1]
+
+        self.unrolled.reverse_blocks(
+            before, len(self._unrolled_row_blocks(before, self.len))
+        )
 
-        new_list.reverse()
-        self.linkedlist = new_list
+    def reverse_seq_mmap(self, k: int) -> None:
+        """
+        Reverses the k-th sequence of the memory-mapped RefGrid. The mapping is
+        copy-on-write, so only the pages holding row k are copied and the file itself is
+        left untouched.
+        """
+        if k < 0 or k >= self.rows:  # no such row
+            return
+
+        start = k * self.stride
+        stop = start + self.len
+        self.mapping[start:stop] = self.mapping[start:stop][::-1]
 
     def cut_and_splice(self, pattern: str, plen: int, target: str, tlen: int) -> None:
         """
         Replaces all occurrences of pattern with target in the RefGrid, storing the
         result in the `linkedlist` member.
         """
-        for _ in range(self.rows):
-            self.extlist.append(self.len)
+        self._track_row_lengths()
 
         replace_inc = tlen - plen
         match_len = 0
@@ -151,8 +578,7 @@ class RefGrid:
 
             if match_len == plen:
                 node = self.join(before, node.get_next(), target, tlen)
-                self.linkedlist.set_size(self.linkedlist.get_size() + replace_inc)
-                self.extlist.set_at(row, self.extlist.get_at(row) + replace_inc)
+                self.row_lengths.set_at(row, self.row_lengths.get_at(row) + replace_inc)
                 column += replace_inc
                 match_len = 0
                 before = node
@@ -161,11 +587,164 @@ class RefGrid:
             node = node.get_next()
             column += 1
 
-            if column == self.extlist.get_at(row):
+            if column == self.row_lengths.get_at(row):
                 match_len = 0
                 row += 1
                 column = 0
                 before = previous
+                self.row_index.set_at(row, previous)
+
+    def cut_and_splice_parallel(
+        self, pattern: str, plen: int, target: str, tlen: int, workers: int
+    ) -> None:
+        """
+        Replaces all occurrences of pattern with target in the RefGrid as
+        `cut_and_splice` does, finding the matches on a pool of worker processes.
+
+        Matches never cross rows, so the rows are split into contiguous partitions,
+        each sent to a worker as one newline-separated string, and the workers return
+        the offsets of the matches in each row (see `_find_partition`). Back in this
+        process, each row with matches is walked only up to its last match, and the
+        matches are replaced in place with `join`.
+        """
+        self._track_row_lengths()
+        size = max(-(-self.rows // (workers * 4)), 1)  # a few partitions per worker
+        starts = range(0, self.rows, size)
+        partitions = [
+            "\n".join(self.iter_rows(start, start + size)) for start in starts
+        ]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            found = executor.map(
+                _find_partition, partitions, [pattern] * len(partitions)
+            )
+            for start, matches in zip(starts, found):
+                for row, offsets in matches:
+                    self._splice_offsets(start + row, offsets, plen, target, tlen)
+
+    def _splice_offsets(
+        self, row: int, offsets: list[int], plen: int, target: str, tlen: int
+    ) -> None:
+        """
+        Replaces the plen nodes at each of the given offsets into row with target,
+        keeping the row index and row lengths up to date. The offsets are those of
+        the row before splicing, in increasing order and not overlapping.
+        """
+        before = self.row_index.get_at(row)
+        node = self.get_row_start(row)
+        column = 0
+
+        for offset in offsets:
+            for _ in range(offset - column):
+                before = node
+                node = node.get_next()
+            after = node
+            for _ in range(plen):
+                after = after.get_next()
+
+            before = self.join(before, after, target, tlen)
+            node = after
+            column = offset + plen
+
+        length = self.row_lengths.get_at(row)
+        self.row_lengths.set_at(row, length + len(offsets) * (tlen - plen))
+        if column == length and row + 1 < self.rows:  # the row's last node changed
+            self.row_index.set_at(row + 1, before)
+
+    def cut_and_splice_rules(self, rules: list[tuple[str, str]]) -> None:
+        """
+        Applies every (pattern, target) rule to the RefGrid in a single traversal,
+        storing the result in the `linkedlist` member.
+
+        One automaton matches all of the patterns at once. Within each row, matches are
+        taken leftmost-longest: at the leftmost position where any pattern matches,
+        the longest such pattern is replaced, and matching resumes after it. Replaced
+        text is never rescanned, matches never cross rows, and if two rules share a
+        pattern the first one wins. With a single rule this is `cut_and_splice`.
+        """
+        automaton = AhoCorasick([pattern for pattern, _ in rules])
+        self._track_row_lengths()
+        before = None
+
+        for row in range(self.rows):
+            nodes = []
+            node = self.get_row_start(row)
+            for _ in range(self.row_length(row)):
+                nodes.append(node)
+                node = node.get_next()
+
+            length = len(nodes)
+            position = 0
+            for start, rule in automaton.leftmost_longest(
+                [node.get_data() for node in nodes]
+            ):
+                pattern, target = rules[rule]
+                if start > position:
+                    before = nodes[start - 1]
+                after = nodes[start + len(pattern) - 1].get_next()
+                before = self.join(before, after, target, len(target))
+                length += len(target) - len(pattern)
+                position = start + len(pattern)
+
+            if position < len(nodes):
+                before = nodes[-1]
+            self.row_lengths.set_at(row, length)
+            self.row_index.set_at(row + 1, before)
+
+    def cut_and_splice_packed(
+        self, pattern: str, plen: int, target: str, tlen: int
+    ) -> None:
+        """
+        Replaces all occurrences of pattern with target in the RefGrid, storing the
+        result in the `packed` member and the new row lengths in `row_lengths`.
+
+        As in `cut_and_splice`, matches never cross rows and are replaced left to
+        right without overlapping. `validate_patterns` guarantees the pattern has no
+        repeated base, so a match can never start inside an earlier partial match and
+        the rows can be spliced with `str.replace`.
+        """
+        spliced = PackedList()
+
+        for k in range(self.rows):
+            start = k * self.len
+            row = self.packed.to_string(start, start + self.len).replace(
+                pattern, target
+            )
+            spliced.extend(row)
+            self.row_lengths.append(len(row))
+
+        self.packed = spliced
+
+    def cut_and_splice_unrolled(
+        self, pattern: str, plen: int, target: str, tlen: int
+    ) -> None:
+        """
+        Replaces all occurrences of pattern with target in the RefGrid, storing the
+        result in the `unrolled` member and the new row lengths in `row_lengths`.
+
+        Each row is spliced as a whole (see `cut_and_splice_packed`), and only the rows
+        that contain the pattern have their blocks replaced.
+        """
+        capacity = self.unrolled.get_capacity()
+        before = None
+
+        for _ in range(self.rows):
+            blocks = self._unrolled_row_blocks(before, self.len)
+            row = "".join("".join(block.get_data()) for block in blocks)
+            spliced = row.replace(pattern, target)
+            self.row_lengths.append(len(spliced))
+
+            if spliced == row:
+                if len(blocks) > 0:
+                    before = blocks[-1]
+                continue
+
+            for _ in blocks:
+                self.unrolled.remove_block_after(before)
+            for i in range(0, len(spliced), capacity):
+                block = UnrolledNode(list(spliced[i : i + capacity]))
+                self.unrolled.insert_block_after(before, block)
+                before = block
 
     def join(
         self,
@@ -173,9 +752,11 @@ class RefGrid:
         after: SingleNode | None,
         target: str,
         tlen: int,
-    ) -> None:
+    ) -> SingleNode:
         """
-        Joins the target to the linked list.
+        Joins the target to the linked list, replacing any nodes between before and
+        after, and returns the last target node. The list's size and tail are kept up
+        to date.
 
         If both before and after are not None, target will be inserted between them.
         head -> ... -> before -> target[0] -> ... -> target[-1] -> after -> ... -> null
@@ -189,18 +770,30 @@ class RefGrid:
         If both before and after are None, target will replace the entire linked list.
         head -> target[0] -> ... -> target[-1] -> null
         """
-        node = SingleNode(target[0])
+        # cut out the nodes between before and after, recycling them
+        node = before.get_next() if before is not None else self.linkedlist.get_head()
+        removed = 0
+        while node is not after:
+            following = node.get_next()
+            self.linkedlist.release_node(node)
+            node = following
+            removed += 1
 
         if before is not None:
-            before.set_next(node)
+            before.set_next(after)
         else:
-            self.linkedlist.set_head(node)
+            self.linkedlist.set_head(after)
+        if after is None:
+            self.linkedlist.set_tail(before)
+        self.linkedlist.set_size(self.linkedlist.get_size() - removed)
 
-        for i in range(1, tlen):
-            node.set_next(SingleNode(target[i]))
-            node = node.get_next()
+        # build the target as its own list, then link it in as one segment
+        segment = SingleLinkedList(self.linkedlist.get_pool())
+        for i in range(tlen):
+            segment.insert_to_back(self.linkedlist.new_node(target[i]))
 
-        node.set_next(after)
+        node = segment.get_tail()
+        self.linkedlist.splice_after(before, segment)
         return node
 
     def right(self, idx: int) -> int:
@@ -215,39 +808,381 @@ class RefGrid:
             return 0
         return idx + self.len
 
-    def is_viable(self) -> bool:
-        """Returns whether the RefGrid is viable for cloning."""
-        my_stack = LStack()
-        visited = SingleLinkedList()
+    def _is_reachable(self, cell: Callable[[int], object]) -> bool:
+        """
+        Returns whether the last cell of the RefGrid can be reached from the first by
+        moving right or below through cells equal to the first, where cell(idx) reads
+        the cell at index idx.
+
+        Each cell is visited at most once: visited cells are one bit each in a
+        bytearray, and the frontier is an array of cell indices, so the search is
+        linear in the number of cells.
+        """
+        end = self.rows * self.len - 1
+        if end < 0:
+            return False
+
+        visited = bytearray((end >> 3) + 1)
+        frontier = array("q", [0])
+        visited[0] = 1
         current = 0
-        end = self.extlist.get_size() - 1
-        base = self.extlist.get_at(current)
-        my_stack.push(current)
-        visited.insert_to_front(SingleNode(current))
-
-        while not my_stack.empty() and current != end:
-            current = my_stack.pop()
-            right_idx = self.right(current)
-            below_idx = self.below(current)
-
-            if (
-                right_idx != 0
-                and self.extlist.get_at(right_idx) == base
-                and not visited.find_element(right_idx)
-            ):
-                my_stack.push(right_idx)
-                visited.insert_to_front(SingleNode(right_idx))
+        base = cell(current)
 
-            if (
-                below_idx != 0
-                and self.extlist.get_at(below_idx) == base
-                and not visited.find_element(below_idx)
-            ):
-                my_stack.push(below_idx)
-                visited.insert_to_front(SingleNode(below_idx))
+        while len(frontier) > 0 and current != end:
+            current = frontier.pop()
+
+            for neighbour in (self.right(current), self.below(current)):
+                if (
+                    neighbour != 0
+                    and not visited[neighbour >> 3] & 1 << (neighbour & 7)
+                    and cell(neighbour) == base
+                ):
+                    frontier.append(neighbour)
+                    visited[neighbour >> 3] |= 1 << (neighbour & 7)
 
         return current == end
 
+    def is_viable(self) -> bool:
+        """Returns whether the RefGrid is viable for cloning."""
+        return self._is_reachable(self.extlist.get_at)
+
+    def is_viable_numpy(self) -> bool:
+        """
+        Returns whether the RefGrid is viable for cloning, propagating reachability one
+        row at a time with NumPy. Falls back to `is_viable` if NumPy is not installed.
+
+        A cell is reachable if it holds the base and either the cell above it is
+        reachable or it is in the same run of the base as a cell that is. Each row is
+        decoded into a `uint8` vector and only the previous row's reachability is
+        kept, so the extra memory is O(len).
+        """
+        if np is None:
+            return self.is_viable()
+        if self.rows * self.len == 0:
+            return False
+
+        columns = np.arange(self.len)
+        base = ord(self.extlist.get_at(0))
+        reachable = np.zeros(self.len, dtype=bool)
+        reachable[0] = True  # seeds the first row
+
+        for row in range(self.rows):
+            start = row * self.len
+            cells = np.frombuffer(
+                "".join(self.extlist.get_slice(start, start + self.len)).encode(),
+                dtype=np.uint8,
+            )
+            matches = cells == base
+            seeds = matches & reachable
+
+            # a cell is reached if a seed comes after the last non-base cell before it
+            last_seed = np.maximum.accumulate(np.where(seeds, columns, -1))
+            last_gap = np.maximum.accumulate(np.where(matches, -1, columns))
+            reachable = matches & (last_seed > last_gap)
+
+            if not reachable.any():
+                return False
+
+        return bool(reachable[-1])
+
+    def build_reachability_index(self) -> None:
+        """
+        Precomputes the reachability of the extensible list so that any number of
+        `is_viable_between` queries can follow.
+        """
+        self.reachability = ReachabilityIndex(list(self.iter_extlist_rows()))
+
+    def is_viable_between(self, start: int, end: int) -> bool:
+        """
+        Returns whether cell end can be reached from cell start by moving right or
+        below through cells holding the base of cell start, in a few word operations
+        per row between them (see `ReachabilityIndex`). The index is built on first
+        use. `is_viable` is the query from 0 to the last cell.
+        """
+        if self.reachability is None:
+            self.build_reachability_index()
+        return self.reachability.reaches(start, end)
+
+    def is_viable_packed(self) -> bool:
+        """Returns whether the packed RefGrid is viable for cloning."""
+        return self._is_reachable(self.packed.get_at)
+
+    def is_viable_mmap(self) -> bool:
+        """
+        Returns whether the memory-mapped RefGrid is viable for cloning. Bases are read
+        from the mapping as they are reached, so unreachable parts of the file are
+        never paged in.
+        """
+        return self._is_reachable(lambda idx: self.mapping[self._mmap_offset(idx)])
+
+
+def _chunk_bounds(input_file: str, chunks: int) -> list[int]:
+    """
+    Splits a file into at most chunks byte ranges that each end just after a line
+    ending (or at the end of the file), returned as their boundary offsets. Where the
+    rows all have the first row's length, each range but the last holds a multiple
+    of 4 rows, so its bases pack into whole bytes.
+    """
+    with open(input_file, "rb") as f:
+        step = len(f.readline()) * 4  # the bytes in 4 rows
+        size = f.seek(0, 2)
+        bounds = [0]
+        for i in range(1, chunks):
+            target = size * i // chunks // max(step, 1) * step
+            if target <= bounds[-1]:
+                continue
+            f.seek(target - 1)
+            f.readline()  # stays at target if a line ends just before it
+            if f.tell() >= size:
+                break
+            bounds.append(f.tell())
+        bounds.append(size)
+
+    return bounds
+
+
+def _parse_chunk(input_file: str, start: int, stop: int) -> tuple[bytes, int, int]:
+    """
+    Reads the rows in bytes [start, stop) of a RefGrid file, for `read_parallel`, and
+    returns them as one run of 2-bit packed bases with the number of rows and their
+    length. If the rows differ in length or hold anything but a, c, g and t, raises a
+    `ValueError`.
+    """
+    with open(input_file, "rb") as f:
+        f.seek(start)
+        lines = f.read(stop - start).split(b"\n")
+    if len(lines) > 0 and len(lines[-1].strip()) == 0:
+        lines.pop()  # the line ending of the last row
+
+    rows = [line.strip() for line in lines]
+    length = len(rows[0]) if len(rows) > 0 else 0
+    for row in rows:
+        if len(row) != length:
+            raise ValueError(f"{input_file} has rows of different lengths")
+        if len(row.translate(None, b"acgt")) > 0:
+            raise ValueError(f"{input_file} holds bases other than a, c, g and t")
+
+    bases = PackedList()
+    bases.extend(str(b"".join(rows), "ascii"))
+    return bases.to_bytes(), len(rows), length
+
+
+def _find_partition(partition: str, pattern: str) -> list[tuple[int, list[int]]]:
+    """
+    Finds pattern in a partition of rows joined by newlines, for
+    `cut_and_splice_parallel`, and returns each row that holds it with the offsets of
+    its matches, left to right and not overlapping. Patterns hold only bases, so no
+    match spans a newline, and `validate_patterns` forbids repeated bases, so these
+    are the matches `cut_and_splice` makes.
+    """
+    matches = []
+
+    for row, line in enumerate(partition.split("\n")):
+        offsets = []
+        offset = line.find(pattern)
+        while offset != -1:
+            offsets.append(offset)
+            offset = line.find(pattern, offset + len(pattern))
+        if len(offsets) > 0:
+            matches.append((row, offsets))
+
+    return matches
+
+
+class PhaseTimer:
+    """
+    Splits a run into consecutive phases (e.g. load, op, output), each timed with
+    `perf_counter` from the end of the one before. While `STATS` is counting, the
+    events counted in each phase are kept too.
+    """
+
+    def __init__(self):
+        """Starts timing the first phase."""
+
+        self._last: float = time.perf_counter()
+        """When the current phase began."""
+
+        self._last_counts: dict[str, int] = STATS.get_counts()
+        """The `STATS` counts when the current phase began."""
+
+        self._phases: dict[str, float] = {}
+        """The seconds spent in each phase so far, in the order they first ended."""
+
+        self._counts: dict[str, dict[str, int]] = {}
+        """The events counted in each phase so far."""
+
+    def mark(self, phase: str) -> None:
+        """Ends the current phase, adding its time to phase, and starts the next."""
+        now = time.perf_counter()
+        self._phases[phase] = self._phases.get(phase, 0.0) + now - self._last
+        self._last = now
+
+        if STATS.on:
+            counts = STATS.get_counts()
+            phase_counts = self._counts.setdefault(phase, {})
+            for event, total in counts.items():
+                amount = total - self._last_counts.get(event, 0)
+                if amount > 0:
+                    phase_counts[event] = phase_counts.get(event, 0) + amount
+            self._last_counts = counts
+
+    def get_phases(self) -> dict[str, float]:
+        """Returns the seconds spent in each phase."""
+        return dict(self._phases)
+
+    def get_counts(self) -> dict[str, dict[str, int]]:
+        """Returns the events counted in each phase."""
+        return {phase: dict(counts) for phase, counts in self._counts.items()}
+
+
+def profile_report(profiler: cProfile.Profile, limit: int = 25) -> list[dict]:
+    """Returns the limit functions with the most time in themselves, hottest first."""
+    stats = pstats.Stats(profiler).stats
+    hottest = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)
+    report = []
+
+    for (file, line, name), (primitive, calls, tottime, cumtime, _) in hottest[:limit]:
+        report.append(
+            {
+                "function": f"{file}:{line}({name})",
+                "calls": calls,
+                "primitive_calls": primitive,
+                "tottime": tottime,
+                "cumtime": cumtime,
+            }
+        )
+
+    return report
+
+
+def memory_report(limit: int = 10) -> dict:
+    """Returns the traced current and peak memory and the top allocation sites."""
+    current, peak = tracemalloc.get_traced_memory()
+    sites = tracemalloc.take_snapshot().statistics("lineno")[:limit]
+
+    return {
+        "current_bytes": current,
+        "peak_bytes": peak,
+        "top": [
+            {"site": str(site.traceback), "bytes": site.size, "count": site.count}
+            for site in sites
+        ],
+    }
+
+
+def write_rows(rows: Iterable[str], sink: IO, buffer_size: int = 1 << 16) -> None:
+    """
+    Writes each row followed by a newline to a text or binary sink (e.g.
+    `sys.stdout.buffer` or an open file), batching rows into writes of about
+    `buffer_size` characters. Only one batch is held in memory at a time.
+    """
+    binary = not isinstance(sink, io.TextIOBase)
+    batch = []
+    pending = 0
+
+    for row in rows:
+        batch.append(row)
+        pending += len(row) + 1
+        if pending >= buffer_size:
+            batch.append("")  # so the join ends with a newline
+            chunk = "\n".join(batch)
+            sink.write(chunk.encode() if binary else chunk)
+            batch = []
+            pending = 0
+
+    if len(batch) > 0:
+        batch.append("")
+        chunk = "\n".join(batch)
+        sink.write(chunk.encode() if binary else chunk)
+    sink.flush()
+
+
+def parse_pipeline(spec: str) -> list[tuple]:
+    """
+    Parses a comma-separated list of operations, e.g. "reverse:3,splice:gta:atc,
+    check-clone", into (name, *arguments) steps. If an operation is unknown or its
+    arguments are malformed, raises a `ValueError`.
+    """
+    steps = []
+
+    for operation in spec.split(","):
+        name, *arguments = operation.strip().split(":")
+        if name == "reverse" and len(arguments) == 1:
+            steps.append((name, int(arguments[0])))
+        elif name == "splice" and len(arguments) == 2:
+            steps.append((name, *arguments))
+        elif name == "check-clone" and len(arguments) == 0:
+            steps.append((name,))
+        else:
+            raise ValueError(f"Unknown pipeline operation: {operation!r}")
+
+    return steps
+
+
+def run_pipeline(
+    refgrid: RefGrid,
+    input_file: str,
+    steps: list[tuple],
+    out: IO = sys.stdout,
+    phases: Optional[PhaseTimer] = None,
+) -> None:
+    """
+    Loads a RefGrid file once and applies each step of a pipeline to it in order,
+    printing to out as the single-operation modes do. The grid is printed once at the
+    end if any step changed it.
+
+    Reversal and splicing work on the linked list and cloning checks on the extensible
+    list. The RefGrid is loaded into the form the first step needs and copied into the
+    other form only when a step needs it and that form is out of date. If phases is
+    given, loading, each step (as "<position>:<name>") and output are marked in it.
+    """
+    phases = phases if phases is not None else PhaseTimer()
+    linkedlist_current = False
+    extlist_current = False
+    changed = False
+
+    for position, step in enumerate(steps):
+        name = step[0]
+
+        if name in ("reverse", "splice") and not linkedlist_current:
+            if extlist_current:
+                refgrid.extlist_to_linkedlist()
+                phases.mark("convert")
+            else:
+                refgrid.read_to_linkedlist(input_file)
+                phases.mark("load")
+            linkedlist_current = True
+        elif name == "check-clone" and not extlist_current:
+            if linkedlist_current:
+                refgrid.linkedlist_to_extlist()
+                phases.mark("convert")
+            else:
+                refgrid.read_to_extlist(input_file)
+                phases.mark("load")
+            extlist_current = True
+
+        if name == "reverse":
+            print("Testing reverse k with k =", step[1], file=out)
+            refgrid.reverse_seq(step[1])
+            extlist_current = False
+            changed = True
+        elif name == "splice":
+            _, pattern, target = step
+            print(
+                "Testing cut-and-splice with P =", pattern, "and T =", target, file=out
+            )
+            refgrid.cut_and_splice(pattern, len(pattern), target, len(target))
+            extlist_current = False
+            changed = True
+        elif name == "check-clone":
+            print("Testing viability via L-Path:", refgrid.is_viable(), file=out)
+        phases.mark(f"{position}:{name}")
+
+    if changed:
+        out.flush()
+        write_rows(refgrid.iter_rows(), out)
+        phases.mark("output")
+
 
 def validate_patterns(pattern: str, target: str) -> bool:
     """Returns whether the pattern and target are valid."""
@@ -294,44 +1229,286 @@ if __name__ == "__main__":
     parser.add_argument(
         "--cut-and-splice",
         type=str,
-        help="Cut and splice pattern P with T. Use format P:T (eg: --cut-and-splice gta:atcgc",
+        action="append",
+        help="Cut and splice pattern P with T. Use format P:T (eg: --cut-and-splice gta:atcgc"
+        "). Repeat to apply several rules in one pass.",
+    )
+    parser.add_argument(
+        "--rules-file",
+        type=str,
+        help="Path to a file of cut-and-splice rules, one P:T per line.",
     )
     parser.add_argument(
         "--check-clone",
         action="store_true",
         help="Check if the RefGrid is viable for cloning.",
     )
+    parser.add_argument(
+        "--pipeline",
+        type=str,
+        help="Load once and run several operations in order, e.g. "
+        "--pipeline reverse:3,splice:gta:atc,check-clone",
+    )
+    parser.add_argument(
+        "--check-clone-batch",
+        type=str,
+        help="Path to a file of viability queries, one 'start end' pair of cell "
+        "indices per line, answered from one precomputed index.",
+    )
+    parser.add_argument(
+        "--clone-engine",
+        choices=["dfs", "numpy"],
+        default="dfs",
+        help="How --check-clone searches: a depth-first search, or NumPy row "
+        "propagation (lists backend only; falls back to dfs without NumPy).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Parse and pack the RefGrid file on the packed backend (or for --cache), "
+        "and find the matches of a single --cut-and-splice rule on the lists backend, "
+        "on this many worker processes.",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Load the RefGrid from a binary cache next to the file (path + .bin), "
+        "building it when it is missing or stale.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the run with cProfile, writing the hottest functions as JSON "
+        "to stderr.",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Trace allocations with tracemalloc, writing the peak and the top "
+        "allocation sites as JSON to stderr.",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Write the seconds spent loading, operating and writing output as JSON "
+        "to stderr.",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Count the work done inside the data structures (resizes, copies, nodes "
+        "walked and reversed, stack pushes and pops) in each phase, as JSON to stderr.",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["lists", "packed", "unrolled", "mmap"],
+        default="lists",
+        help="Storage for the RefGrid: the linked/extensible lists, 2-bit packed, an "
+        "unrolled linked list (--reverse-k and --cut-and-splice only), or a lazily "
+        "read memory map (--reverse-k and --check-clone only).",
+    )
     args = parser.parse_args()
 
     if len(sys.argv) == 1:  # no arguments passed
         parser.print_help()
         sys.exit(-1)
 
+    rules = list(args.cut_and_splice or [])
+    if args.rules_file is not None:
+        with open(args.rules_file) as f:
+            for line in f:
+                if line.strip() and not line.startswith("#"):
+                    rules.append(line.strip())
+
+    if args.backend == "mmap" and len(rules) > 0:
+        parser.error("--backend mmap does not support --cut-and-splice")
+    if args.backend in ("packed", "unrolled") and len(rules) > 1:
+        parser.error(f"--backend {args.backend} only supports a single splice rule")
+    if args.backend == "unrolled" and args.check_clone:
+        parser.error("--backend unrolled does not support --check-clone")
+    if args.backend != "lists" and args.check_clone_batch is not None:
+        parser.error("--check-clone-batch needs --backend lists")
+    if args.check_clone and args.clone_engine == "numpy" and args.backend != "lists":
+        parser.error("--clone-engine numpy needs --backend lists")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and args.backend == "mmap":
+        parser.error("--backend mmap reads lazily and does not support --workers")
+    if args.cache and args.backend == "mmap":
+        parser.error("--backend mmap reads lazily and does not support --cache")
+
     my_refgrid = RefGrid()
+    phases = PhaseTimer()
+    profiler = cProfile.Profile() if args.profile else None
+
+    def report() -> None:
+        """Writes what --profile, --trace-memory, --timings and --stats collected."""
+        phases.mark("exit")
+        results = {}
+        if args.timings:
+            results["timings"] = phases.get_phases()
+        if args.trace_memory:
+            results["memory"] = memory_report()
+            tracemalloc.stop()
+        if args.stats:
+            STATS.stop()
+            results["stats"] = phases.get_counts()
+        if profiler is not None:
+            profiler.disable()
+            results["profile"] = profile_report(profiler)
+        print(json.dumps(results), file=sys.stderr)
+
+    if args.profile or args.trace_memory or args.timings or args.stats:
+        atexit.register(report)  # every mode ends in sys.exit
+    if args.stats:
+        STATS.start()
+    if args.trace_memory:
+        tracemalloc.start()
+    if profiler is not None:
+        profiler.enable()
+
+    def read(form: str) -> None:
+        """
+        Reads the RefGrid into the given form, as --cache and --workers ask. If the
+        file is malformed, prints the error and exits.
+        """
+        try:
+            if args.cache:
+                my_refgrid.read_cached(args.refgrid, form, args.workers)
+            elif args.workers > 1 and form == "packed":
+                my_refgrid.read_parallel(args.refgrid, args.workers)
+            else:
+                getattr(my_refgrid, "read_to_" + form)(args.refgrid)
+        except ValueError as e:
+            print("Error:", e)
+            sys.exit(-1)
+        phases.mark("load")
+
+    if args.pipeline is not None:
+        try:
+            steps = parse_pipeline(args.pipeline)
+        except ValueError as e:
+            parser.error(str(e))
+        for step in steps:
+            if step[0] == "splice" and not validate_patterns(step[1], step[2]):
+                sys.exit(-1)
+        try:
+            run_pipeline(my_refgrid, args.refgrid, steps, phases=phases)
+        except ValueError as e:  # a check-clone after splicing left ragged rows
+            print("Error:", e)
+            sys.exit(-1)
+        sys.exit(0)
 
     # Task 2.1: Reverse-k
     if args.reverse_k is not None:
         print("Testing reverse k with k =", args.reverse_k)
-        my_refgrid.read_to_linkedlist(args.refgrid)
-        my_refgrid.reverse_seq(args.reverse_k)
-        print(my_refgrid.stringify_linkedlist(), end="")
+        sys.stdout.flush()  # the grid is written straight to the binary buffer
+        if args.backend == "packed":
+            read("packed")
+            my_refgrid.reverse_seq_packed(args.reverse_k)
+            phases.mark("op")
+            write_rows(my_refgrid.iter_packed_rows(), sys.stdout.buffer)
+            phases.mark("output")
+        elif args.backend == "unrolled":
+            read("unrolled")
+            my_refgrid.reverse_seq_unrolled(args.reverse_k)
+            phases.mark("op")
+            write_rows(my_refgrid.iter_unrolled_rows(), sys.stdout.buffer)
+            phases.mark("output")
+        elif args.backend == "mmap":
+            read("mmap")
+            my_refgrid.reverse_seq_mmap(args.reverse_k)
+            phases.mark("op")
+            write_rows(my_refgrid.iter_mmap_rows(), sys.stdout.buffer)
+            phases.mark("output")
+        else:
+            read("linkedlist")
+            my_refgrid.reverse_seq(args.reverse_k)
+            phases.mark("op")
+            write_rows(my_refgrid.iter_rows(), sys.stdout.buffer)
+            phases.mark("output")
         sys.exit(0)
 
     # Task 2.2 Cut and Splice
-    if args.cut_and_splice is not None:
-        pattern, target = args.cut_and_splice.split(":")
+    if len(rules) > 1:
+        pairs = [tuple(rule.split(":")) for rule in rules]
+        for pattern, target in pairs:
+            if not validate_patterns(pattern, target):
+                sys.exit(-1)
+        for pattern, target in pairs:
+            print("Testing cut-and-splice with P =", pattern, "and T =", target)
+        sys.stdout.flush()
+        read("linkedlist")
+        my_refgrid.cut_and_splice_rules(pairs)
+        phases.mark("op")
+        write_rows(my_refgrid.iter_rows(), sys.stdout.buffer)
+        phases.mark("output")
+        sys.exit(0)
+
+    if len(rules) == 1:
+        pattern, target = rules[0].split(":")
         if not validate_patterns(pattern, target):
             sys.exit(-1)
         print("Testing cut-and-splice with P =", pattern, "and T =", target)
-        my_refgrid.read_to_linkedlist(args.refgrid)
-        my_refgrid.cut_and_splice(pattern, len(pattern), target, len(target))
-        print(my_refgrid.stringify_spliced_linkedlist(), end="")
+        sys.stdout.flush()
+        if args.backend == "packed":
+            read("packed")
+            my_refgrid.cut_and_splice_packed(pattern, len(pattern), target, len(target))
+            phases.mark("op")
+            write_rows(my_refgrid.iter_packed_rows(), sys.stdout.buffer)
+            phases.mark("output")
+        elif args.backend == "unrolled":
+            read("unrolled")
+            my_refgrid.cut_and_splice_unrolled(
+                pattern, len(pattern), target, len(target)
+            )
+            phases.mark("op")
+            write_rows(my_refgrid.iter_unrolled_rows(), sys.stdout.buffer)
+            phases.mark("output")
+        else:
+            read("linkedlist")
+            if args.workers > 1:
+                my_refgrid.cut_and_splice_parallel(
+                    pattern, len(pattern), target, len(target), args.workers
+                )
+            else:
+                my_refgrid.cut_and_splice(pattern, len(pattern), target, len(target))
+            phases.mark("op")
+            write_rows(my_refgrid.iter_rows(), sys.stdout.buffer)
+            phases.mark("output")
         sys.exit(0)
 
     # Task 2.3 Cloning Viability
     if args.check_clone:
-        # use the extlist to store the data based on Barry Malloc's implementation
-        my_refgrid.read_to_extlist(args.refgrid)
-        is_viable = my_refgrid.is_viable()
+        if args.backend == "packed":
+            read("packed")
+            is_viable = my_refgrid.is_viable_packed()
+        elif args.backend == "mmap":
+            read("mmap")
+            is_viable = my_refgrid.is_viable_mmap()
+        else:
+            # use the extlist to store the data based on Barry Malloc's implementation
+            read("extlist")
+            if args.clone_engine == "numpy":
+                is_viable = my_refgrid.is_viable_numpy()
+            else:
+                is_viable = my_refgrid.is_viable()
+        phases.mark("op")
         print("Testing viability via L-Path:", is_viable)
+        phases.mark("output")
+        sys.exit(0)
+
+    # Task 2.3 Cloning Viability, many queries over one grid
+    if args.check_clone_batch is not None:
+        read("extlist")
+        my_refgrid.build_reachability_index()
+        with open(args.check_clone_batch) as f:
+            for line in f:
+                if not line.strip() or line.startswith("#"):
+                    continue
+                start, end = (int(idx) for idx in line.split())
+                is_viable = my_refgrid.is_viable_between(start, end)
+                print(f"Testing viability via L-Path from {start} to {end}:", is_viable)
+        phases.mark("op")
         sys.exit(0)
@@ -0,0 +1,126 @@
+import argparse
+import random
+import sys
+from typing import Optional
+
+BASES: str = "acgt"
+"""The nucleotide alphabet."""
+
+
+def generate(
+    rows: int,
+    length: int,
+    seed: int = 0,
+    weights: Optional[list[float]] = None,
+    pattern: Optional[str] = None,
+    density: float = 0.0,
+    viable: Optional[bool] = None,
+) -> list[str]:
+    """
+    Generates a RefGrid of rows rows of the given length, the same for the same
+    arguments.
+
+    Bases are drawn independently with the given weights (for a, c, g and t).
+    Then, at each position, pattern is planted with probability density, where it
+    fits in the row. Last, if viable is True, a random staircase of right and below
+    moves from the first cell to the last is set to the first cell's base, so the
+    grid is viable for cloning. If it is False, the last cell is set to another
+    base, so it is not; a grid of one cell is always viable, so asking for that
+    raises a `ValueError`.
+    """
+    if viable is False and rows == 1 and length == 1:
+        raise ValueError("a grid of one cell is always viable")
+
+    rng = random.Random(seed)
+    grid = [rng.choices(BASES, weights=weights, k=length) for _ in range(rows)]
+
+    if pattern is not None and density > 0:
+        for row in grid:
+            i = 0
+            while i + len(pattern) <= length:
+                if rng.random() < density:
+                    row[i : i + len(pattern)] = pattern
+                    i += len(pattern)
+                else:
+                    i += 1
+
+    if viable is not None and rows > 0 and length > 0:
+        base = grid[0][0]
+        if viable:
+            r = c = 0
+            while (r, c) != (rows - 1, length - 1):
+                if c == length - 1 or (r < rows - 1 and rng.random() < 0.5):
+                    r += 1
+                else:
+                    c += 1
+                grid[r][c] = base
+        else:
+            grid[-1][-1] = rng.choice(BASES.replace(base, ""))
+
+    return ["".join(row) for row in grid]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="COMP3506/7505 Assignment One: DNA-RefGrid generator"
+    )
+    parser.add_argument("--rows", type=int, required=True, help="Number of rows.")
+    parser.add_argument("--len", type=int, required=True, help="Length of each row.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument(
+        "--weights",
+        type=str,
+        help="Comma-separated relative weights of a, c, g and t (eg: 4,1,1,1).",
+    )
+    parser.add_argument(
+        "--pattern",
+        type=str,
+        help="A pattern to plant throughout the grid (eg: gta).",
+    )
+    parser.add_argument(
+        "--density",
+        type=float,
+        default=0.0,
+        help="Probability of planting --pattern at each position.",
+    )
+    parser.add_argument(
+        "--viable",
+        choices=["yes", "no", "any"],
+        default="any",
+        help="Guarantee the grid is (or is not) viable for cloning.",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="Path to write the RefGrid to instead of stdout.",
+    )
+    args = parser.parse_args()
+
+    weights = None
+    if args.weights is not None:
+        weights = [float(weight) for weight in args.weights.split(",")]
+        if len(weights) != len(BASES):
+            parser.error("--weights needs one weight per base")
+    if args.pattern is not None and (
+        len(args.pattern) == 0 or any(base not in BASES for base in args.pattern)
+    ):
+        parser.error("--pattern must be made of a, c, g and t")
+
+    try:
+        grid = generate(
+            args.rows,
+            args.len,
+            args.seed,
+            weights,
+            args.pattern,
+            args.density,
+            {"yes": True, "no": False, "any": None}[args.viable],
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            f.writelines(row + "\n" for row in grid)
+    else:
+        sys.stdout.writelines(row + "\n" for row in grid)
@@ -0,0 +1,103 @@
+from typing import Sequence
+
+
+class AhoCorasick:
+    """
+    An Aho-Corasick automaton over a fixed set of patterns. A text is scanned once,
+    following goto edges where they exist and failure links where they don't, so the
+    cost of a scan does not grow with the number of patterns.
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        """Builds the automaton for the given (non-empty) patterns."""
+
+        self._patterns: list[str] = list(patterns)
+        """The patterns, indexed by the position they were given in."""
+
+        self._goto: list[dict[str, int]] = [{}]
+        """The trie edges out of each state. State 0 is the root."""
+
+        self._fail: list[int] = [0]
+        """The failure link of each state."""
+
+        self._out: list[list[int]] = [[]]
+        """The patterns that end at each state, including via failure links."""
+
+        for index, pattern in enumerate(self._patterns):
+            self.__add(index, pattern)
+        self.__link()
+
+    def __add(self, index: int, pattern: str) -> None:
+        """Adds a pattern to the trie."""
+        state = 0
+        for character in pattern:
+            if character not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][character] = len(self._goto) - 1
+            state = self._goto[state][character]
+
+        # keep the first rule for a repeated pattern
+        if not any(self._patterns[i] == pattern for i in self._out[state]):
+            self._out[state].append(index)
+
+    def __link(self) -> None:
+        """Computes the failure links breadth first, merging outputs along them."""
+        queue = list(self._goto[0].values())
+
+        for state in queue:  # the queue grows as we go
+            for character, child in self._goto[state].items():
+                queue.append(child)
+
+                fallback = self._fail[state]
+                while fallback != 0 and character not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(character, 0)
+                self._fail[child] = link if link != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def get_pattern(self, index: int) -> str:
+        """Returns the pattern with the given index."""
+        return self._patterns[index]
+
+    def longest_at(self, text: Sequence[str]) -> list[int]:
+        """
+        Scans the text once and returns, for each position, the index of the longest
+        pattern that starts there, or -1 if none does.
+        """
+        longest = [-1] * len(text)
+        state = 0
+
+        for end, character in enumerate(text):
+            while state != 0 and character not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(character, 0)
+
+            for index in self._out[state]:
+                start = end - len(self._patterns[index]) + 1
+                best = longest[start]
+                if best == -1 or len(self._patterns[index]) > len(self._patterns[best]):
+                    longest[start] = index
+
+        return longest
+
+    def leftmost_longest(self, text: Sequence[str]) -> list[tuple[int, int]]:
+        """
+        Returns the non-overlapping matches in the text as (start, pattern index)
+        pairs, in order. Scanning left to right, the match taken at each position is
+        the longest pattern starting there, and scanning resumes after it.
+        """
+        longest = self.longest_at(text)
+        matches = []
+        start = 0
+
+        while start < len(text):
+            index = longest[start]
+            if index == -1:
+                start += 1
+            else:
+                matches.append((start, index))
+                start += len(self._patterns[index])
+
+        return matches
@@ -1,4 +1,7 @@
-from typing import Generic, Optional, TypeVar
+from itertools import islice
+from typing import Callable, Generic, Iterable, Iterator, Optional, Sequence, TypeVar
+
+from structures.m_stats import STATS
 
 Datum = TypeVar("Datum")
 """Generic type for the payload of an extensible list."""
@@ -6,9 +9,46 @@ Datum = TypeVar("Datum")
 INITIAL_CAPACITY: int = 4
 """The initial capacity of a new list."""
 
+GrowthPolicy = Callable[[int, int], int]
+"""
+Computes a list's new capacity from its current capacity and the minimum capacity it
+needs.
+"""
+
+
+def cpython_growth(capacity: int, minimum: int) -> int:
+    """
+    Grows the capacity by 1/8 of itself, plus 6, rounded up to the nearest multiple of
+    4. This is the same factor used by the CPython implementation of `list`.
+    See https://github.com/python/cpython/blob/bace59d8b8e38f5c779ff6296ebdc0527f6db14a/Objects/listobject.c#L62.
+    """
+    new_capacity = (capacity + (capacity >> 3) + 6) & ~3
+    if new_capacity < minimum:
+        # a bulk insert needs more than one step; size from the target instead
+        new_capacity = (minimum + (minimum >> 3) + 6) & ~3
+    return new_capacity
+
+
+def geometric_growth(factor: float = 2.0) -> GrowthPolicy:
+    """Returns a policy that multiplies the capacity by `factor` (> 1)."""
+
+    def grow(capacity: int, minimum: int) -> int:
+        return max(int(capacity * factor), minimum)
+
+    return grow
+
+
+def fixed_chunk_growth(chunk: int = 1024) -> GrowthPolicy:
+    """Returns a policy that adds capacity in whole multiples of `chunk` (> 0)."""
+
+    def grow(capacity: int, minimum: int) -> int:
+        return -(-minimum // chunk) * chunk
+
+    return grow
+
 
 class ExtensibleList(Generic[Datum]):
-    def __init__(self):
+    def __init__(self, growth_policy: GrowthPolicy = cpython_growth):
         """Initialise an empty list with some initial capacity."""
 
         self._data = [None] * INITIAL_CAPACITY
@@ -20,42 +60,56 @@ class ExtensibleList(Generic[Datum]):
         self._capacity = INITIAL_CAPACITY
         """The list's capacity."""
 
+        self._growth_policy = growth_policy
+        """Computes the new capacity when the list is full."""
+
+        self._resize_count = 0
+        """The number of times the list's data has been reallocated."""
+
+        self._copy_count = 0
+        """The number of elements copied while reallocating the list's data."""
+
     def __str__(self) -> str:
         """Stringifies the list, including empty cells."""
-        string_rep = "[ "
-
-        first = True
-        for i in range(self.get_capacity()):
-            if not first:
-                string_rep += ", "
-
-            if i < self.get_size():
-                string_rep += f"{self.get_at(i)}"
-            else:
-                string_rep += "EMPTY"
-
-            first = False
-
-        string_rep += " ]"
-        return string_rep
-
-    def __resize(self) -> None:
-        """Increases the list's size."""
-        # The new capacity is the old capacity plus 1/8 of the old capacity, plus 6,
-        # rounded up to the nearest multiple of 4. This is the same factor used by the
-        # CPython implementation of `list`.
-        # See https://github.com/python/cpython/blob/bace59d8b8e38f5c779ff6296ebdc0527f6db14a/Objects/listobject.c#L62.
-        new_capacity = (self.get_capacity() + (self.get_capacity() >> 3) + 6) & ~3
+        cells = [f"{element}" for element in self._data[: self.get_size()]]
+        cells.extend(["EMPTY"] * (self.get_capacity() - self.get_size()))
+        return "[ " + ", ".join(cells) + " ]"
+
+    def __resize(self, minimum: int) -> None:
+        """Increases the list's size so that it holds at least `minimum` elements."""
+        new_capacity = self._growth_policy(self.get_capacity(), minimum)
+        self.__reallocate(max(new_capacity, minimum))
+
+    def __reallocate(self, new_capacity: int) -> None:
+        """Moves the list's data into a new block with the given capacity."""
         new_data = [None] * new_capacity
 
-        for i in range(self.get_size()):
-            new_data[i] = self._data[i]
+        size = self.get_size()
+        new_data[:size] = self._data[:size]
 
         self._capacity, self._data = new_capacity, new_data
+        self._resize_count += 1
+        self._copy_count += size
+        if STATS.on:
+            STATS.record("extlist.resize")
+            STATS.record("extlist.copy", size)
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Ensures the list can hold at least `capacity` elements without resizing, e.g.
+        ahead of a load whose size is known.
+        """
+        if capacity > self.get_capacity():
+            self.__reallocate(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """Reduces the list's capacity to its size, releasing the unused cells."""
+        if self.get_capacity() > self.get_size():
+            self.__reallocate(self.get_size())
 
     def reset(self) -> None:
-        """Resets the list to its initial form."""
-        self.__init__()
+        """Resets the list to its initial form, keeping its growth policy."""
+        self.__init__(self._growth_policy)
 
     def __getitem__(self, index: int) -> Datum:
         """
@@ -100,12 +154,65 @@ class ExtensibleList(Generic[Datum]):
     def append(self, element: Datum) -> None:
         """Adds an element to the end of the list. Resizes the list where necessary."""
         if self.is_full():
-            self.__resize()
+            self.__resize(self.get_size() + 1)
 
         index = self.get_size()
         self.set_size(self.get_size() + 1)
         self[index] = element
 
+    def __len__(self) -> int:
+        """Returns the number of elements in the list."""
+        return self.get_size()
+
+    def __iter__(self) -> Iterator[Datum]:
+        """Iterates over the elements of the list in order, without copying them."""
+        return islice(self._data, self.get_size())
+
+    def iter_range(self, start: int, stop: int) -> Iterator[Datum]:
+        """
+        Iterates over the elements in the range [start, stop), clamped to the list's
+        bounds, without copying them.
+        """
+        return islice(self._data, max(start, 0), min(stop, self.get_size()))
+
+    def view(self, start: int, stop: int) -> "ListView[Datum]":
+        """
+        Returns a read-only view of the elements in the range [start, stop), clamped
+        to the list's bounds, that reads the list's data without copying it.
+        """
+        start = max(start, 0)
+        return ListView(self, start, max(min(stop, self.get_size()), start))
+
+    def get_slice(self, start: int, stop: int) -> list[Datum]:
+        """
+        Returns a copy of the elements in the range [start, stop), clamped to the
+        list's bounds.
+        """
+        return self._data[max(start, 0) : min(stop, self.get_size())]
+
+    def extend(self, elements: Iterable[Datum]) -> None:
+        """
+        Adds every element of the iterable to the end of the list. The capacity is
+        checked once and the elements are copied in as a single block.
+        """
+        if not isinstance(elements, Sequence):
+            elements = list(elements)
+
+        size = self.get_size()
+        new_size = size + len(elements)
+        if new_size > self.get_capacity():
+            self.__resize(new_size)
+
+        self._data[size:new_size] = elements
+        self.set_size(new_size)
+
+    def extend_from_buffer(self, buffer: bytes | bytearray | memoryview) -> None:
+        """
+        Adds each byte of an ASCII buffer to the end of the list as a one-character
+        string, e.g. a row of bases read from a file opened in binary mode.
+        """
+        self.extend(str(buffer, "ascii"))
+
     def remove(self, element: Datum) -> None:
         """
         Removes the first instance of the given element. Ensures elements remain
@@ -153,3 +260,61 @@ class ExtensibleList(Generic[Datum]):
     def set_capacity(self, capacity: int) -> None:
         """Sets the total capacity of the list."""
         self._capacity = capacity
+
+    def get_resize_count(self) -> int:
+        """Returns the number of times the list's data has been reallocated."""
+        return self._resize_count
+
+    def get_copy_count(self) -> int:
+        """Returns the number of elements copied while reallocating."""
+        return self._copy_count
+
+
+class ListView(Generic[Datum]):
+    """
+    A read-only window onto the range [start, stop) of an `ExtensibleList`. The view
+    reads the list's data when it is used rather than copying it, so it sees later
+    writes to the range; the range itself is fixed when the view is made.
+    """
+
+    __slots__ = ("_list", "_start", "_stop")
+
+    def __init__(self, ex_list: ExtensibleList[Datum], start: int, stop: int):
+        """Creates a view of the range [start, stop) of ex_list."""
+
+        self._list: ExtensibleList[Datum] = ex_list
+        """The list being viewed."""
+
+        self._start: int = start
+        """The index of the first element in the view."""
+
+        self._stop: int = stop
+        """The index after the last element in the view."""
+
+    def __len__(self) -> int:
+        """Returns the number of elements in the view."""
+        return self._stop - self._start
+
+    def __iter__(self) -> Iterator[Datum]:
+        """Iterates over the elements of the view in order."""
+        return self._list.iter_range(self._start, self._stop)
+
+    def __getitem__(self, index: int) -> Datum:
+        """
+        Returns the element at the given index of the view. If the index is outside
+        the view, raises an `IndexError`.
+        """
+        if index < 0 or index >= len(self):
+            raise IndexError()
+
+        return self._list[self._start + index]
+
+    def get_at(self, index: int) -> Optional[Datum]:
+        """
+        Returns the element at the given index of the view. If the index is outside
+        the view, returns `None`.
+        """
+        try:
+            return self[index]
+        except IndexError:
+            return None
@@ -0,0 +1,185 @@
+from typing import Optional
+
+BASES: str = "acgt"
+"""The nucleotide alphabet. A base is stored as its index in this string."""
+
+BASES_PER_BYTE: int = 4
+"""The number of 2-bit bases packed into each byte."""
+
+_ENCODE: dict[str, int] = {base: code for code, base in enumerate(BASES)}
+"""Maps a single base to its 2-bit code."""
+
+_ENCODE4: dict[str, int] = {
+    a + b + c + d: _ENCODE[a] | _ENCODE[b] << 2 | _ENCODE[c] << 4 | _ENCODE[d] << 6
+    for a in BASES
+    for b in BASES
+    for c in BASES
+    for d in BASES
+}
+"""Maps a run of four bases to the byte they pack into."""
+
+_DECODE4: list[str] = [
+    BASES[b & 3] + BASES[b >> 2 & 3] + BASES[b >> 4 & 3] + BASES[b >> 6 & 3]
+    for b in range(256)
+]
+"""Maps a packed byte to the run of four bases it holds."""
+
+
+class PackedList:
+    """
+    A list of nucleotide bases (a, c, g, t) stored at two bits per base in a
+    `bytearray`. Base i lives in byte i // 4, at bit offset 2 * (i % 4).
+    """
+
+    def __init__(self):
+        """Initialise an empty list."""
+
+        self._data: bytearray = bytearray()
+        """The packed bases."""
+
+        self._size: int = 0
+        """The number of bases stored in the list."""
+
+    def __str__(self) -> str:
+        """Stringifies the list as a run of bases."""
+        return self.to_string(0, self.get_size())
+
+    def __getitem__(self, index: int) -> str:
+        """
+        Returns the base at the given index. If the index is outside the required
+        bounds, raises an `IndexError`.
+        """
+        if index < 0 or index >= self.get_size():
+            raise IndexError()
+
+        return BASES[self._data[index >> 2] >> ((index & 3) << 1) & 3]
+
+    def get_at(self, index: int) -> Optional[str]:
+        """
+        Returns the base at the given index. If the index is outside the required
+        bounds, returns `None`.
+        """
+        try:
+            return self[index]
+        except IndexError:
+            return None
+
+    def __setitem__(self, index: int, base: str) -> None:
+        """
+        Sets the base at the given index. If the index is outside the required bounds,
+        raises an `IndexError`. If the base is not one of a, c, g or t, raises a
+        `ValueError`.
+        """
+        if index < 0 or index >= self.get_size():
+            raise IndexError()
+
+        if base not in _ENCODE:
+            raise ValueError(f"Invalid base: {base!r}")
+
+        shift = (index & 3) << 1
+        byte = index >> 2
+        self._data[byte] = self._data[byte] & ~(3 << shift) | _ENCODE[base] << shift
+
+    def set_at(self, index: int, base: str) -> None:
+        """
+        Sets the base at the given index. If the index is outside the required bounds,
+        does nothing.
+        """
+        try:
+            self[index] = base
+        except IndexError:
+            pass
+
+    def append(self, base: str) -> None:
+        """Adds a base to the end of the list."""
+        if self.get_size() & 3 == 0:
+            self._data.append(0)
+
+        index = self.get_size()
+        self.set_size(self.get_size() + 1)
+        try:
+            self[index] = base
+        except ValueError:
+            self.set_size(index)
+            if index & 3 == 0:
+                self._data.pop()
+            raise
+
+    def extend(self, bases: str) -> None:
+        """
+        Adds a run of bases to the end of the list. Whole bytes are encoded four bases
+        at a time.
+        """
+        i = 0
+        n = len(bases)
+
+        # top up a partially filled last byte first
+        while i < n and self.get_size() & 3 != 0:
+            self.append(bases[i])
+            i += 1
+
+        whole = i + ((n - i) & ~3)
+        try:
+            self._data += bytes(_ENCODE4[bases[j : j + 4]] for j in range(i, whole, 4))
+        except KeyError:
+            raise ValueError(f"Invalid base in: {bases[i:whole]!r}") from None
+        self.set_size(self.get_size() + whole - i)
+
+        for j in range(whole, n):
+            self.append(bases[j])
+
+    def extend_packed(self, data: bytes, size: int) -> None:
+        """
+        Adds size bases already packed into data (as from `to_bytes`) to the end of
+        the list. If the list ends on a byte boundary the bytes are appended as they
+        are; otherwise the bases are unpacked and re-encoded.
+        """
+        if self.get_size() & 3 == 0:
+            self._data += data[: (size + 3) >> 2]
+            self.set_size(self.get_size() + size)
+        else:
+            decoded = "".join([_DECODE4[b] for b in data[: (size + 3) >> 2]])
+            self.extend(decoded[:size])
+
+    def to_bytes(self) -> bytes:
+        """Returns a copy of the packed bases, for `extend_packed`."""
+        return bytes(self._data)
+
+    def to_string(self, start: int, stop: int) -> str:
+        """Returns the bases in the range [start, stop) as a string."""
+        start = max(start, 0)
+        stop = min(stop, self.get_size())
+        if start >= stop:
+            return ""
+
+        first = start >> 2
+        last = (stop + 3) >> 2
+        decoded = "".join([_DECODE4[b] for b in self._data[first:last]])
+        offset = first << 2
+        return decoded[start - offset : stop - offset]
+
+    def reverse_range(self, start: int, stop: int) -> None:
+        """Reverses the bases in the range [start, stop) in place."""
+        bases = self.to_string(start, stop)
+        for i, base in enumerate(reversed(bases), start):
+            self[i] = base
+
+    def reset(self) -> None:
+        """Resets the list to its initial form."""
+        self.__init__()
+
+    def is_empty(self) -> bool:
+        """Returns whether the list is empty."""
+        return self.get_size() == 0
+
+    def get_size(self) -> int:
+        """Returns the number of bases stored in the list."""
+        return self._size
+
+    def set_size(self, size: int) -> None:
+        """Sets the number of bases stored in the list."""
+        self._size = size
+
+    def get_nbytes(self) -> int:
+        """Returns the number of bytes used to store the bases."""
+        return len(self._data)
@@ -0,0 +1,80 @@
+from typing import Optional, Sequence
+
+BASES: str = "acgt"
+"""The nucleotide alphabet."""
+
+
+class ReachabilityIndex:
+    """
+    Answers whether one cell of a grid can reach another by moving right or below
+    through cells holding the same base, after a one-time precomputation.
+
+    The precomputation turns each row into one int bitset per base, with bit c set
+    where column c holds that base. A query propagates a bitset of reachable cells
+    one row at a time from the start row to the end row: the cells below reachable
+    cells are reachable if they hold the base, and reachability then runs right
+    along each run of the base in a single addition. Each row costs a few int
+    operations on len bits, so a query is O((end row - start row) * len / w) for a
+    machine word of w bits, and stops early once no cell is reachable. The index
+    holds 4 bits per cell, half the size of the grid's text.
+    """
+
+    def __init__(self, rows: Sequence[str]):
+        """Precomputes the index for a grid given as equal-length rows."""
+
+        self._rows: int = len(rows)
+        """The number of rows in the grid."""
+
+        self._len: int = len(rows[0]) if len(rows) > 0 else 0
+        """The length of each row."""
+
+        self._masks: dict[str, list[int]] = {base: [] for base in BASES}
+        """
+        For each base, a bitset per row with bit c set where column c holds the base.
+        """
+
+        tables = {
+            base: bytes(ord("1") if i == ord(base) else ord("0") for i in range(256))
+            for base in BASES
+        }
+        for row in rows:
+            encoded = row.encode()[::-1]  # column 0 as the lowest bit
+            for base, table in tables.items():
+                bits = int(encoded.translate(table), 2) if len(row) > 0 else 0
+                self._masks[base].append(bits)
+
+    def __base_at(self, r: int, c: int) -> Optional[str]:
+        """Returns the base at row r and column c, or `None` if it is not a base."""
+        for base, masks in self._masks.items():
+            if masks[r] >> c & 1:
+                return base
+        return None
+
+    def reaches(self, start: int, end: int) -> bool:
+        """
+        Returns whether the cell at index end can be reached from the cell at index
+        start (indices count along the rows) through cells holding start's base.
+        """
+        size = self._rows * self._len
+        if start < 0 or end < 0 or start >= size or end >= size:
+            return False
+
+        r1, c1 = divmod(start, self._len)
+        r2, c2 = divmod(end, self._len)
+        base = self.__base_at(r1, c1)
+        if r1 > r2 or c1 > c2 or base is None or base != self.__base_at(r2, c2):
+            return False
+
+        masks = self._masks[base]
+        limit = (1 << c2 + 1) - 1  # columns past the end cell can't lead back to it
+        reach = 1 << c1
+
+        for r in range(r1, r2 + 1):
+            row = masks[r] & limit
+            seeds = reach & row
+            # the addition carries each run's lowest seed up to the end of its run
+            reach = row & ((row + seeds) ^ row) | seeds
+            if reach == 0:
+                return False
+
+        return reach >> c2 & 1 == 1
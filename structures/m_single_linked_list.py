@@ -1,10 +1,14 @@
-from typing import Generic, Optional, TypeVar
+from typing import Generic, Iterator, Optional, TypeVar
+
+from structures.m_stats import STATS
 
 Datum = TypeVar("Datum")
 """Generic type for the payload of a linked list."""
 
 
 class SingleNode(Generic[Datum]):
+    __slots__ = ("_data", "_next")
+
     def __init__(self, data: Datum):
         """Initialise with some data and a null next pointer."""
 
@@ -30,17 +34,117 @@ class SingleNode(Generic[Datum]):
         """Gets the pointer to the next node."""
         return self._next
 
+    @staticmethod
+    def iter_data(
+        first: "Optional[SingleNode[Datum]]", count: int
+    ) -> Iterator[Optional[Datum]]:
+        """
+        Iterates over the data of up to count linked nodes starting at first, stopping
+        early at None. The nodes' fields are read directly rather than through their
+        accessors, which halves the cost of walking a long run.
+        """
+        node = first
+        for _ in range(count):
+            if node is None:
+                return
+            yield node._data
+            node = node._next
+
+
+class NodePool(Generic[Datum]):
+    """
+    A free list of detached nodes. Lists that share a pool hand the nodes they discard
+    back to it and reuse them for new elements instead of allocating.
+    """
+
+    def __init__(self, limit: int = 1 << 16):
+        """Initialise an empty pool that keeps at most `limit` nodes."""
+
+        self._free: Optional[SingleNode[Datum]] = None
+        """The first free node; the rest are chained through their next pointers."""
+
+        self._size: int = 0
+        """The number of free nodes in the pool."""
+
+        self._limit: int = limit
+        """The maximum number of free nodes kept by the pool."""
+
+    def acquire(self, data: Datum) -> SingleNode[Datum]:
+        """Returns a detached node holding data, reusing a free node if there is one."""
+        node = self._free
+        if node is None:
+            return SingleNode(data)
+
+        self._free = node.get_next()
+        self._size -= 1
+        node.set_data(data)
+        node.set_next(None)
+        return node
+
+    def release(self, node: SingleNode[Datum]) -> None:
+        """
+        Returns a node that is no longer linked into any list to the pool. If the pool
+        is full, the node is left for the garbage collector.
+        """
+        if self._size >= self._limit:
+            return
+
+        node.set_data(None)
+        node.set_next(self._free)
+        self._free = node
+        self._size += 1
+
+    def get_size(self) -> int:
+        """Returns the number of free nodes in the pool."""
+        return self._size
+
+
+class NodeView(Generic[Datum]):
+    """
+    A read-only view of the data of a run of linked nodes: up to `count` nodes starting
+    at `first`. The nodes are walked each time the view is iterated (see
+    `SingleNode.iter_data`), so nothing is copied.
+    """
+
+    __slots__ = ("_first", "_count")
+
+    def __init__(self, first: Optional[SingleNode[Datum]], count: int):
+        """Creates a view of count nodes starting at first."""
+
+        self._first: Optional[SingleNode[Datum]] = first
+        """The first node in the view."""
+
+        self._count: int = count
+        """The number of nodes in the view."""
+
+    def __len__(self) -> int:
+        """Returns the number of nodes the view was made over."""
+        return self._count
+
+    def __iter__(self) -> Iterator[Optional[Datum]]:
+        """Iterates over the data of each node in the view, stopping early at None."""
+        return SingleNode.iter_data(self._first, self._count)
+
 
 class SingleLinkedList(Generic[Datum]):
-    def __init__(self):
-        """Initialize with no nodes and a size of zero."""
+    def __init__(self, pool: Optional[NodePool[Datum]] = None):
+        """
+        Initialize with no nodes and a size of zero. If a pool is given, new nodes are
+        drawn from it and deleted nodes are returned to it.
+        """
 
         self._head: Optional[SingleNode[Datum]] = None
         """The head of the list."""
 
+        self._tail: Optional[SingleNode[Datum]] = None
+        """The last node of the list."""
+
         self._size: int = 0
         """The number of elements stored in the linked list."""
 
+        self._pool: Optional[NodePool[Datum]] = pool
+        """The pool that nodes are drawn from and returned to, if any."""
+
     def get_size(self) -> int:
         """Returns the number of elements stored in the linked list."""
         return self._size
@@ -54,21 +158,65 @@ class SingleLinkedList(Generic[Datum]):
         return self._head
 
     def set_head(self, node: Optional[SingleNode[Datum]]) -> None:
-        """Sets the head element."""
+        """
+        Sets the head element. Callers that relink nodes directly are responsible for
+        keeping the tail up to date with `set_tail`.
+        """
         self._head = node
 
+    def get_tail(self) -> Optional[SingleNode[Datum]]:
+        """Returns the last element."""
+        return self._tail
+
+    def set_tail(self, node: Optional[SingleNode[Datum]]) -> None:
+        """Sets the last element."""
+        self._tail = node
+
+    def get_pool(self) -> Optional[NodePool[Datum]]:
+        """Returns the list's node pool, if it has one."""
+        return self._pool
+
+    def new_node(self, data: Datum) -> SingleNode[Datum]:
+        """Returns a detached node holding data, drawn from the pool if there is one."""
+        if self._pool is not None:
+            return self._pool.acquire(data)
+        return SingleNode(data)
+
+    def release_node(self, node: SingleNode[Datum]) -> None:
+        """
+        Returns a node that has been unlinked from the list to the pool, if there is
+        one.
+        """
+        if self._pool is not None:
+            self._pool.release(node)
+
+    def __len__(self) -> int:
+        """Returns the number of elements stored in the linked list."""
+        return self.get_size()
+
+    def __iter__(self) -> Iterator[Optional[Datum]]:
+        """Iterates over the data of each node, from the head."""
+        return iter(NodeView(self.get_head(), self.get_size()))
+
+    def view(self, first: Optional[SingleNode[Datum]], count: int) -> "NodeView[Datum]":
+        """
+        Returns a read-only view of the data of count nodes starting at first, which
+        walks the nodes only when it is iterated.
+        """
+        return NodeView(first, count)
+
     def __str__(self) -> str:
         """Stringifies the list."""
-        string_rep = ""
+        parts = []
         current = self.get_head()
 
         while current is not None:
             # assumes the data stored in current has `__str__` implemented
-            string_rep += str(current.get_data()) + " -> "
+            parts.append(str(current.get_data()) + " -> ")
             current = current.get_next()
 
-        string_rep += "[EOL]"  # end of list == None
-        return string_rep
+        parts.append("[EOL]")  # end of list == None
+        return "".join(parts)
 
     def traverse_and_delete(self) -> None:
         """
@@ -85,11 +233,14 @@ class SingleLinkedList(Generic[Datum]):
             current.set_next(None)
             # delete the data
             current.set_data(None)
+            # hand the node back for reuse
+            self.release_node(current)
             # move forward
             current = next
 
-        # don't forget to remove the ref to the head node
+        # don't forget to remove the refs to the head and tail nodes
         self.set_head(None)
+        self.set_tail(None)
         # and reset the size
         self.set_size(0)
 
@@ -97,26 +248,58 @@ class SingleLinkedList(Generic[Datum]):
         """Inserts a node to the front of the list."""
         node.set_next(self.get_head())
 
+        # check corner case; the first node is also the last
+        if self.get_head() is None:
+            self.set_tail(node)
+
         self.set_head(node)
         self.set_size(self.get_size() + 1)
 
     def insert_to_back(self, node: SingleNode) -> None:
-        """Inserts a node to the back of the list."""
-        current = self.get_head()
+        """Inserts a node to the back of the list in constant time."""
+        node.set_next(None)
+        tail = self.get_tail()
 
         # check corner case; the head is yet to be set
-        if current is None:
+        if tail is None:
             self.set_head(node)
-            self.set_size(self.get_size() + 1)
+        else:
+            tail.set_next(node)
+
+        self.set_tail(node)
+        self.set_size(self.get_size() + 1)
+
+    def concat(self, other: "SingleLinkedList[Datum]") -> None:
+        """
+        Moves all of the nodes of other to the back of this list in constant time,
+        leaving other empty.
+        """
+        self.splice_after(self.get_tail(), other)
+
+    def splice_after(
+        self, node: Optional[SingleNode[Datum]], other: "SingleLinkedList[Datum]"
+    ) -> None:
+        """
+        Moves all of the nodes of other into this list directly after node, or to the
+        front of the list if node is None, in constant time. Other is left empty.
+        """
+        if other.get_head() is None:  # nothing to splice
             return
 
-        # keep going until the next of the current node is empty
-        while current.get_next() is not None:
-            current = current.get_next()
+        if node is None:
+            other.get_tail().set_next(self.get_head())
+            self.set_head(other.get_head())
+        else:
+            other.get_tail().set_next(node.get_next())
+            node.set_next(other.get_head())
 
-        # we are now on the last valid node, let's insert
-        current.set_next(node)
-        self.set_size(self.get_size() + 1)
+        if other.get_tail().get_next() is None:
+            self.set_tail(other.get_tail())
+        self.set_size(self.get_size() + other.get_size())
+
+        other.set_head(None)
+        other.set_tail(None)
+        other.set_size(0)
 
     def remove_from_front(self) -> Optional[SingleNode[Datum]]:
         """
@@ -128,6 +311,8 @@ class SingleLinkedList(Generic[Datum]):
 
         node = self.get_head()
         self.set_head(node.get_next())
+        if self.get_head() is None:
+            self.set_tail(None)
         self.set_size(self.get_size() - 1)
 
         return node
@@ -143,10 +328,13 @@ class SingleLinkedList(Generic[Datum]):
         if self.get_size() == 1:  # just the head element
             current = self.get_head()
             self.set_head(None)
+            self.set_tail(None)
             self.set_size(self.get_size() - 1)
             return current
 
         # more than one element - let's walk the list
+        if STATS.on:
+            STATS.record("linkedlist.walked", self.get_size() - 1)
         prev = None
         current = self.get_head()
 
@@ -156,6 +344,7 @@ class SingleLinkedList(Generic[Datum]):
             current = current.get_next()
 
         prev.set_next(None)
+        self.set_tail(prev)
         self.set_size(self.get_size() - 1)
         return current
 
@@ -166,12 +355,22 @@ class SingleLinkedList(Generic[Datum]):
         """
         current = self.get_head()
 
+        if STATS.on:  # the same walk, counting the nodes visited
+            walked = 0
+            while current is not None:
+                walked += 1
+                if current.get_data() == element:
+                    break
+                current = current.get_next()
+            STATS.record("linkedlist.walked", walked)
+            return current
+
         while current is not None:
             if current.get_data() == element:
-                return current
+                break
             current = current.get_next()
 
-        return None
+        return current
 
     def find_and_remove_element(self, element: Datum) -> Optional[SingleNode[Datum]]:
         """
@@ -187,27 +386,79 @@ class SingleLinkedList(Generic[Datum]):
 
         # corner case: if prev (head) is the element, we need to fix the head ptr
         if previous.get_data() == element:
+            if STATS.on:
+                STATS.record("linkedlist.walked", 1)
             self.set_head(current)
+            if current is None:
+                self.set_tail(None)
             self.set_size(self.get_size() - 1)
             return previous
 
-        while current is not None:  # walk the list
-            if current.get_data() == element:  # we found it
-                previous.set_next(current.get_next())
-                self.set_size(self.get_size() - 1)
-                return current
+        if STATS.on:  # the same walk, counting the nodes visited
+            walked = 1
+            while current is not None and current.get_data() != element:
+                previous = current
+                current = current.get_next()
+                walked += 1
+            STATS.record("linkedlist.walked", walked if current is None else walked + 1)
+        else:
+            # walk the list until we find it
+            while current is not None and current.get_data() != element:
+                previous = current
+                current = current.get_next()
+
+        if current is None:  # not in the list
+            return None
+
+        previous.set_next(current.get_next())
+        if current is self.get_tail():
+            self.set_tail(previous)
+        self.set_size(self.get_size() - 1)
+        return current
+
+    def reverse_after(self, node: Optional[SingleNode[Datum]], count: int) -> None:
+        """
+        Reverses the `count` nodes after node, or the first `count` nodes if node is
+        None, in place. Only those nodes are visited. If count is zero, does nothing.
+        """
+        if count <= 0:
+            return
 
-            # keep moving forward otherwise
+        first = self.get_head() if node is None else node.get_next()
+        previous = None
+        current = first
+        moved = 0
+
+        while moved < count and current is not None:  # fewer than count may remain
+            next = current.get_next()
+            current.set_next(previous)
             previous = current
-            current = current.get_next()
+            current = next
+            moved += 1
+
+        if STATS.on:
+            STATS.record("linkedlist.reversed", moved)
+        if first is None:  # nothing to reverse
+            return
 
-        return None
+        # previous is now the first node of the reversed run and first is its last
+        if node is None:
+            self.set_head(previous)
+        else:
+            node.set_next(previous)
+        first.set_next(current)
+
+        if current is None:
+            self.set_tail(first)
 
     def reverse(self) -> None:
         """Reverses the list."""
+        if STATS.on:
+            STATS.record("linkedlist.reversed", self.get_size())
 
         previous = None
         current = self.get_head()
+        self.set_tail(current)
 
         while current is not None:
             next = current.get_next()
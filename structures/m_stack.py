@@ -1,7 +1,14 @@
-from typing import Generic, Optional, TypeVar
-
-from structures.m_extensible_list import ExtensibleList
-from structures.m_single_linked_list import SingleLinkedList, SingleNode
+from array import array
+from typing import Generic, Iterable, Optional, TypeVar
+
+from structures.m_extensible_list import (
+    INITIAL_CAPACITY,
+    ExtensibleList,
+    GrowthPolicy,
+    cpython_growth,
+)
+from structures.m_single_linked_list import NodePool, SingleLinkedList, SingleNode
+from structures.m_stats import STATS
 
 Datum = TypeVar("Datum")
 """Generic type for the payload of a stack."""
@@ -10,38 +17,30 @@ Datum = TypeVar("Datum")
 class EStack(Generic[Datum], ExtensibleList[Datum]):
     """A stack implementation using the ExtensibleList for object storage."""
 
-    def __init__(self):
+    def __init__(self, growth_policy: GrowthPolicy = cpython_growth):
         """Creates an empty stack."""
-        super().__init__()
+        super().__init__(growth_policy)
 
     def __str__(self) -> str:
-        """Stringifies the stack."""
-        string_rep = ""
-
-        first = True
-        for i in range(self.get_size() - 1, -1, -1):
-            if first:
-                string_rep += "[> "
-            else:
-                string_rep += ", "
-
-            string_rep += str(self.get_at(i))
-
-            if first:
-                string_rep += " <]"
-
-            first = False
+        """Stringifies the stack, top first."""
+        if self.is_empty():
+            return ""
 
-        return string_rep
+        elements = [str(self.get_at(i)) for i in range(self.get_size() - 1, -1, -1)]
+        return "[> " + elements[0] + " <]" + "".join(", " + e for e in elements[1:])
 
     def push(self, element: Datum) -> None:
         """Pushes the given element to the top of the stack."""
+        if STATS.on:
+            STATS.record("estack.push")
         self.append(element)
 
     def pop(self) -> Optional[Datum]:
         """
         Removes and returns the top element. If the stack is empty, returns `None`.
         """
+        if STATS.on:
+            STATS.record("estack.pop")
         return self.remove_at(self.get_size() - 1)
 
     def peek(self) -> Optional[Datum]:
@@ -65,20 +64,29 @@ class EStack(Generic[Datum], ExtensibleList[Datum]):
 class LStack(Generic[Datum], SingleLinkedList[Datum]):
     """A stack implementation using the SingleLinkedList for object storage."""
 
-    def __init__(self):
-        """Creates an empty stack."""
-        super().__init__()
+    def __init__(self, pool: Optional[NodePool[Datum]] = None):
+        """
+        Creates an empty stack. If a pool is given, popped nodes are recycled through it
+        for later pushes.
+        """
+        super().__init__(pool)
 
     def push(self, element: Datum) -> None:
         """Pushes the given element to the top of the stack."""
-        self.insert_to_front(SingleNode(element))
+        if STATS.on:
+            STATS.record("lstack.push")
+        self.insert_to_front(self.new_node(element))
 
     def pop(self) -> Optional[Datum]:
         """
         Removes and returns the top element. If the stack is empty, returns `None`.
         """
+        if STATS.on:
+            STATS.record("lstack.pop")
         if head := self.remove_from_front():
-            return head.get_data()
+            element = head.get_data()
+            self.release_node(head)
+            return element
         return None
 
     def peek(self) -> Optional[Datum]:
@@ -97,6 +105,14 @@ class LStack(Generic[Datum], SingleLinkedList[Datum]):
     def insert_to_back(self, node: SingleNode) -> None:
         raise NotImplementedError()
 
+    def concat(self, other: SingleLinkedList[Datum]) -> None:
+        raise NotImplementedError()
+
+    def splice_after(
+        self, node: SingleNode[Datum] | None, other: SingleLinkedList[Datum]
+    ) -> None:
+        raise NotImplementedError()
+
     def remove_from_back(self) -> SingleNode[Datum] | None:
         raise NotImplementedError()
 
@@ -106,5 +122,106 @@ class LStack(Generic[Datum], SingleLinkedList[Datum]):
     def find_and_remove_element(self, element: Datum) -> SingleNode[Datum] | None:
         raise NotImplementedError()
 
+    def reverse_after(self, node: SingleNode[Datum] | None, count: int) -> None:
+        raise NotImplementedError()
+
     def reverse(self) -> None:
         raise NotImplementedError()
+
+
+class IStack:
+    """
+    A stack of integers stored at 8 bytes each in an `array('q')`, for traversals
+    that push many indices. The array is kept at its capacity and the stack's size
+    is tracked separately, so a pop is an index read. The capacity doubles when
+    full and halves once the stack falls below a quarter of it, but never below the
+    capacity last reserved.
+    """
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        """Creates an empty stack with room for capacity integers."""
+
+        self._data: array = array("q", bytes(8 * capacity))
+        """The elements, bottom first, followed by unused cells."""
+
+        self._size: int = 0
+        """The number of elements on the stack."""
+
+        self._reserved: int = capacity
+        """The capacity the stack never shrinks below."""
+
+    def __str__(self) -> str:
+        """Stringifies the stack, top first."""
+        if self.empty():
+            return ""
+
+        elements = [str(self._data[i]) for i in range(self._size - 1, -1, -1)]
+        return "[> " + elements[0] + " <]" + "".join(", " + e for e in elements[1:])
+
+    def __resize(self, capacity: int) -> None:
+        """Grows or shrinks the array to the given capacity."""
+        if capacity > len(self._data):
+            self._data.frombytes(bytes(8 * (capacity - len(self._data))))
+        else:
+            del self._data[capacity:]
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Ensures the stack can hold capacity integers without resizing, and keeps it
+        from shrinking below that.
+        """
+        self._reserved = capacity
+        if capacity > len(self._data):
+            self.__resize(capacity)
+
+    def push(self, element: int) -> None:
+        """Pushes the given integer to the top of the stack."""
+        if STATS.on:
+            STATS.record("istack.push")
+        if self._size == len(self._data):
+            self.__resize(max(2 * self._size, INITIAL_CAPACITY))
+        self._data[self._size] = element
+        self._size += 1
+
+    def push_many(self, elements: Iterable[int]) -> None:
+        """Pushes the given integers in order, so the last ends on top."""
+        block = array("q", elements)
+        if STATS.on:
+            STATS.record("istack.push", len(block))
+        end = self._size + len(block)
+        if end > len(self._data):
+            self.__resize(max(2 * len(self._data), end))
+        self._data[self._size : end] = block
+        self._size = end
+
+    def pop(self) -> Optional[int]:
+        """
+        Removes and returns the top integer. If the stack is empty, returns `None`.
+        """
+        if self._size == 0:
+            return None
+        if STATS.on:
+            STATS.record("istack.pop")
+
+        self._size -= 1
+        element = self._data[self._size]
+        capacity = len(self._data) >> 1
+        if self._size < capacity >> 1 and capacity >= self._reserved:
+            self.__resize(max(capacity, INITIAL_CAPACITY))
+        return element
+
+    def peek(self) -> Optional[int]:
+        """Returns the top integer. If the stack is empty, returns `None`."""
+        return self._data[self._size - 1] if self._size > 0 else None
+
+    def empty(self) -> bool:
+        """Returns whether the stack is empty."""
+        return self._size == 0
+
+    def get_size(self) -> int:
+        """Returns the number of integers on the stack."""
+        return self._size
+
+    def get_capacity(self) -> int:
+        """Returns the number of integers the stack can hold without growing."""
+        return len(self._data)
@@ -0,0 +1,64 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class Stats:
+    """
+    A registry of counts of the work done inside the data structures, e.g. resizes,
+    elements copied and nodes walked. Counting is off unless switched on, and the
+    structures check `on` before recording, so the cost when off is one attribute
+    test per operation. Loops record their totals once, not per step.
+    """
+
+    __slots__ = ("on", "_counts")
+
+    def __init__(self):
+        """Creates a registry with counting switched off."""
+
+        self.on: bool = False
+        """Whether events are being counted."""
+
+        self._counts: dict[str, int] = {}
+        """The number of times each event has happened while counting."""
+
+    def record(self, event: str, amount: int = 1) -> None:
+        """Adds amount to the count of event."""
+        self._counts[event] = self._counts.get(event, 0) + amount
+
+    def get_counts(self) -> dict[str, int]:
+        """Returns a copy of the counts so far."""
+        return dict(self._counts)
+
+    def start(self) -> None:
+        """Switches counting on."""
+        self.on = True
+
+    def stop(self) -> None:
+        """Switches counting off, keeping the counts so far."""
+        self.on = False
+
+    def reset(self) -> None:
+        """Clears the counts."""
+        self._counts = {}
+
+    @contextmanager
+    def counting(self) -> Iterator[dict[str, int]]:
+        """
+        Counts the events in a with block, yielding a dict that holds that block's
+        counts when it ends. Blocks may nest; an outer block's counts include those of
+        the blocks inside it.
+        """
+        was_on, outer = self.on, self._counts
+        self._counts = inner = {}
+        self.on = True
+        try:
+            yield inner
+        finally:
+            self.on, self._counts = was_on, outer
+            if was_on:
+                for event, amount in inner.items():
+                    self.record(event, amount)
+
+
+STATS: Stats = Stats()
+"""The registry the data structures record into."""
@@ -0,0 +1,304 @@
+from typing import Generic, Optional, TypeVar
+
+Datum = TypeVar("Datum")
+"""Generic type for the payload of an unrolled linked list."""
+
+BLOCK_CAPACITY: int = 64
+"""The default maximum number of elements held by each node."""
+
+
+class UnrolledNode(Generic[Datum]):
+    __slots__ = ("_data", "_next")
+
+    def __init__(self, data: Optional[list[Datum]] = None):
+        """Initialise with a block of data and a null next pointer."""
+
+        self._data: list[Datum] = data if data is not None else []
+        """The block of elements held by the node."""
+
+        self._next: Optional[UnrolledNode[Datum]] = None
+        """Pointer to the next node."""
+
+    def set_data(self, data: list[Datum]) -> None:
+        """Sets the block of elements."""
+        self._data = data
+
+    def get_data(self) -> list[Datum]:
+        """Gets the block of elements."""
+        return self._data
+
+    def set_next(self, node: "Optional[UnrolledNode[Datum]]") -> None:
+        """Sets the pointer to the next node."""
+        self._next = node
+
+    def get_next(self) -> "Optional[UnrolledNode[Datum]]":
+        """Gets the pointer to the next node."""
+        return self._next
+
+
+class UnrolledLinkedList(Generic[Datum]):
+    """
+    A singly linked list whose nodes each hold a block of up to `capacity` elements.
+    It mirrors the `SingleLinkedList` API, but element operations take and return the
+    elements themselves, while `get_head`/`find_element` hand out the nodes (blocks).
+    """
+
+    def __init__(self, capacity: int = BLOCK_CAPACITY):
+        """Initialize with no nodes and a size of zero."""
+
+        self._head: Optional[UnrolledNode[Datum]] = None
+        """The head of the list."""
+
+        self._tail: Optional[UnrolledNode[Datum]] = None
+        """The last node of the list."""
+
+        self._size: int = 0
+        """The number of elements stored in the linked list."""
+
+        self._capacity: int = capacity
+        """The maximum number of elements held by each node."""
+
+    def get_size(self) -> int:
+        """Returns the number of elements stored in the linked list."""
+        return self._size
+
+    def set_size(self, size: int) -> None:
+        """Sets the number of elements stored in the linked list."""
+        self._size = size
+
+    def get_capacity(self) -> int:
+        """Returns the maximum number of elements held by each node."""
+        return self._capacity
+
+    def get_head(self) -> Optional[UnrolledNode[Datum]]:
+        """Returns the head node."""
+        return self._head
+
+    def set_head(self, node: Optional[UnrolledNode[Datum]]) -> None:
+        """Sets the head node."""
+        self._head = node
+
+    def get_tail(self) -> Optional[UnrolledNode[Datum]]:
+        """Returns the last node."""
+        return self._tail
+
+    def set_tail(self, node: Optional[UnrolledNode[Datum]]) -> None:
+        """Sets the last node."""
+        self._tail = node
+
+    def __str__(self) -> str:
+        """Stringifies the list."""
+        # assumes the data stored in each block has `__str__` implemented
+        parts = []
+        current = self.get_head()
+
+        while current is not None:
+            parts.extend(str(element) + " -> " for element in current.get_data())
+            current = current.get_next()
+
+        parts.append("[EOL]")  # end of list == None
+        return "".join(parts)
+
+    def traverse_and_delete(self) -> None:
+        """Deletes all of the nodes in the list one-by-one."""
+        current = self.get_head()
+
+        while current is not None:
+            next = current.get_next()
+            current.set_next(None)
+            current.set_data([])
+            current = next
+
+        self.set_head(None)
+        self.set_tail(None)
+        self.set_size(0)
+
+    def insert_to_front(self, element: Datum) -> None:
+        """Inserts an element to the front of the list."""
+        head = self.get_head()
+
+        if head is None or len(head.get_data()) >= self.get_capacity():
+            head = UnrolledNode()
+            head.set_next(self.get_head())
+            self.set_head(head)
+            if self.get_tail() is None:
+                self.set_tail(head)
+
+        head.get_data().insert(0, element)
+        self.set_size(self.get_size() + 1)
+
+    def insert_to_back(self, element: Datum) -> None:
+        """Inserts an element to the back of the list."""
+        tail = self.get_tail()
+
+        if tail is None or len(tail.get_data()) >= self.get_capacity():
+            tail = UnrolledNode()
+            self.insert_block_after(self.get_tail(), tail)
+
+        tail.get_data().append(element)
+        self.set_size(self.get_size() + 1)
+
+    def insert_block_after(
+        self,
+        before: Optional[UnrolledNode[Datum]],
+        node: UnrolledNode[Datum],
+    ) -> None:
+        """
+        Links a detached node (and its block) in after before, or at the front of the
+        list if before is None. The block may hold fewer elements than the capacity, so
+        callers can keep blocks aligned to their own boundaries.
+        """
+        if before is None:
+            node.set_next(self.get_head())
+            self.set_head(node)
+        else:
+            node.set_next(before.get_next())
+            before.set_next(node)
+
+        if node.get_next() is None:
+            self.set_tail(node)
+        self.set_size(self.get_size() + len(node.get_data()))
+
+    def remove_from_front(self) -> Optional[Datum]:
+        """
+        Removes and returns the element at the front of the list. If the list is empty,
+        returns `None`.
+        """
+        head = self.get_head()
+        if head is None:
+            return None
+
+        element = head.get_data().pop(0)
+        if len(head.get_data()) == 0:
+            self.set_head(head.get_next())
+            if self.get_head() is None:
+                self.set_tail(None)
+
+        self.set_size(self.get_size() - 1)
+        return element
+
+    def remove_from_back(self) -> Optional[Datum]:
+        """
+        Removes and returns the element at the back of the list. If the list is empty,
+        returns `None`.
+        """
+        tail = self.get_tail()
+        if tail is None:
+            return None
+
+        element = tail.get_data().pop()
+        if len(tail.get_data()) == 0:
+            # walk the list to find the new tail
+            previous = None
+            current = self.get_head()
+            while current is not tail:
+                previous = current
+                current = current.get_next()
+
+            if previous is None:
+                self.set_head(None)
+            else:
+                previous.set_next(None)
+            self.set_tail(previous)
+
+        self.set_size(self.get_size() - 1)
+        return element
+
+    def find_element(self, element: Datum) -> Optional[UnrolledNode[Datum]]:
+        """
+        Finds and returns the node holding the element if it exists. If the element is
+        not in the list, returns `None`.
+        """
+        current = self.get_head()
+
+        while current is not None:
+            if element in current.get_data():
+                return current
+            current = current.get_next()
+
+        return None
+
+    def find_and_remove_element(self, element: Datum) -> Optional[Datum]:
+        """
+        Removes and returns the first instance of the element. If the element is not in
+        the list, returns `None`.
+        """
+        previous = None
+        current = self.get_head()
+
+        while current is not None:
+            block = current.get_data()
+            if element in block:
+                found = block.pop(block.index(element))
+                self.set_size(self.get_size() - 1)
+                if len(block) == 0:
+                    self.remove_block_after(previous)
+                return found
+
+            previous = current
+            current = current.get_next()
+
+        return None
+
+    def remove_block_after(
+        self, before: Optional[UnrolledNode[Datum]]
+    ) -> Optional[UnrolledNode[Datum]]:
+        """
+        Unlinks and returns the node after before, or the head if before is None. If
+        there is no such node, returns `None`.
+        """
+        node = self.get_head() if before is None else before.get_next()
+        if node is None:
+            return None
+
+        if before is None:
+            self.set_head(node.get_next())
+        else:
+            before.set_next(node.get_next())
+
+        if node is self.get_tail():
+            self.set_tail(before)
+        node.set_next(None)
+        self.set_size(self.get_size() - len(node.get_data()))
+        return node
+
+    def reverse_blocks(self, before: Optional[UnrolledNode[Datum]], count: int) -> None:
+        """
+        Reverses the elements held by the `count` nodes after before (or from the head
+        if before is None), relinking those nodes in reverse order and reversing each
+        block in place. If count is zero, does nothing.
+        """
+        if count <= 0:
+            return
+
+        first = self.get_head() if before is None else before.get_next()
+        previous = None
+        current = first
+
+        for _ in range(count):
+            next = current.get_next()
+            current.get_data().reverse()
+            current.set_next(previous)
+            previous = current
+            current = next
+
+        # previous is now the first node of the reversed run and first is its last
+        if before is None:
+            self.set_head(previous)
+        else:
+            before.set_next(previous)
+        first.set_next(current)
+
+        if current is None:
+            self.set_tail(first)
+
+    def reverse(self) -> None:
+        """Reverses the list."""
+        count = 0
+        current = self.get_head()
+        while current is not None:
+            count += 1
+            current = current.get_next()
+
+        if count > 0:
+            self.reverse_blocks(None, count)
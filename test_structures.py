@@ -1,11 +1,26 @@
 import argparse
+import io
+import os
 import random
 import sys
+import tempfile
 import time
+from contextlib import contextmanager
+from typing import Iterator
 
-from structures.m_extensible_list import ExtensibleList
-from structures.m_single_linked_list import SingleLinkedList, SingleNode
-from structures.m_stack import EStack, LStack
+from execute_refgrid import RefGrid, parse_pipeline, run_pipeline, write_rows
+from structures.m_aho_corasick import AhoCorasick
+from structures.m_extensible_list import (
+    ExtensibleList,
+    fixed_chunk_growth,
+    geometric_growth,
+)
+from structures.m_packed_list import PackedList
+from structures.m_reachability_index import ReachabilityIndex
+from structures.m_single_linked_list import NodePool, SingleLinkedList, SingleNode
+from structures.m_stack import EStack, IStack, LStack
+from structures.m_stats import STATS
+from structures.m_unrolled_linked_list import UnrolledLinkedList, UnrolledNode
 
 
 def test_single_linked_list():
@@ -41,6 +56,183 @@ def test_single_linked_list():
     assert my_single_list.get_size() == 2
 
 
+def test_single_linked_list_tail():
+    """Tests the tail pointer and constant time joins of the singly linked list."""
+    print("==== Executing Single List Tail Tests ====")
+
+    my_single_list = SingleLinkedList()
+    my_single_list.insert_to_back(SingleNode("hello"))
+    my_single_list.insert_to_back(SingleNode("world"))
+    my_single_list.insert_to_front(SingleNode("goodbye"))
+    assert my_single_list.get_tail().get_data() == "world"
+
+    other = SingleLinkedList()
+    other.insert_to_back(SingleNode("algorithms"))
+    other.insert_to_back(SingleNode("data"))
+    my_single_list.concat(other)
+
+    assert other.get_size() == 0
+    assert other.get_head() == None
+    assert my_single_list.get_size() == 5
+    assert my_single_list.get_tail().get_data() == "data"
+
+    other.insert_to_back(SingleNode("structures"))
+    my_single_list.splice_after(my_single_list.find_element("world"), other)
+    other.insert_to_back(SingleNode("classes"))
+    my_single_list.splice_after(None, other)
+
+    print(str(my_single_list))
+
+    assert str(my_single_list) == (
+        "classes -> goodbye -> hello -> world -> structures -> algorithms -> data -> "
+        "[EOL]"
+    )
+    assert my_single_list.get_size() == 7
+
+    my_single_list.find_and_remove_element("data")
+    assert my_single_list.get_tail().get_data() == "algorithms"
+    my_single_list.remove_from_back()
+    assert my_single_list.get_tail().get_data() == "structures"
+
+    my_single_list.reverse()
+    assert my_single_list.get_tail().get_data() == "classes"
+    my_single_list.insert_to_back(SingleNode("universe"))
+    assert my_single_list.get_head().get_data() == "structures"
+    assert my_single_list.get_tail().get_data() == "universe"
+
+    while my_single_list.remove_from_front() is not None:
+        pass
+    assert my_single_list.get_tail() == None
+
+
+def test_single_linked_list_reverse_after():
+    """Tests in-place reversal of a run of nodes in the singly linked list."""
+    print("==== Executing Single List Partial Reverse Tests ====")
+    my_single_list = SingleLinkedList()
+    for character in "abcdefg":
+        my_single_list.insert_to_back(SingleNode(character))
+
+    my_single_list.reverse_after(None, 3)
+    assert str(my_single_list) == "c -> b -> a -> d -> e -> f -> g -> [EOL]"
+
+    my_single_list.reverse_after(my_single_list.find_element("d"), 3)
+    assert str(my_single_list) == "c -> b -> a -> d -> g -> f -> e -> [EOL]"
+    assert my_single_list.get_tail().get_data() == "e"
+
+    my_single_list.reverse_after(my_single_list.find_element("e"), 2)
+    assert my_single_list.get_tail().get_data() == "e"
+    assert my_single_list.get_size() == 7
+
+    my_single_list.reverse_after(None, 0)  # nothing to reverse
+    my_single_list.reverse_after(my_single_list.find_element("d"), 0)
+    assert str(my_single_list) == "c -> b -> a -> d -> g -> f -> e -> [EOL]"
+    assert my_single_list.get_tail().get_data() == "e"
+
+    print(str(my_single_list))
+
+
+def test_single_linked_list_view():
+    """Tests iteration over the singly linked list and views of its node runs."""
+    print("==== Executing Single List View Tests ====")
+    my_single_list = SingleLinkedList()
+    for character in "gattaca":
+        my_single_list.insert_to_back(SingleNode(character))
+
+    assert len(my_single_list) == 7
+    assert "".join(my_single_list) == "gattaca"
+
+    my_view = my_single_list.view(my_single_list.find_element("c"), 3)
+    assert len(my_view) == 3
+    assert "".join(my_view) == "ca"  # stops at the end of the list
+
+    my_view = my_single_list.view(my_single_list.get_head().get_next(), 4)
+    assert list(my_view) == ["a", "t", "t", "a"]
+    my_single_list.get_head().get_next().set_data("c")
+    assert "".join(my_view) == "ctta"  # reads the nodes, not a copy
+
+    assert list(SingleLinkedList()) == []
+    assert list(my_single_list.view(None, 3)) == []
+
+
+def test_node_pool():
+    """Tests node recycling through a pool shared by linked lists and stacks."""
+    print("==== Executing Node Pool Tests ====")
+    pool = NodePool(limit=3)
+    my_single_list = SingleLinkedList(pool)
+
+    assert not hasattr(SingleNode("hello"), "__dict__")
+
+    for word in ["hello", "world", "algorithms", "data"]:
+        my_single_list.insert_to_front(my_single_list.new_node(word))
+
+    my_single_list.traverse_and_delete()
+    assert my_single_list.get_size() == 0
+    assert pool.get_size() == 3
+
+    my_stack = LStack(pool)
+    my_stack.push("structures")
+    assert pool.get_size() == 2
+    assert my_stack.peek() == "structures"
+
+    assert my_stack.pop() == "structures"
+    assert my_stack.empty()
+    assert pool.get_size() == 3
+
+    node = pool.acquire("classes")
+    assert node.get_data() == "classes"
+    assert node.get_next() is None
+    assert pool.get_size() == 2
+
+
+def test_unrolled_linked_list():
+    """Tests the implementation of the unrolled linked list."""
+    print("==== Executing Unrolled List Tests ====")
+    my_unrolled = UnrolledLinkedList(capacity=2)
+
+    my_unrolled.insert_to_front("hello")
+    my_unrolled.insert_to_front("world")
+    my_unrolled.insert_to_back("algorithms")
+    my_unrolled.insert_to_back("data")
+    my_unrolled.insert_to_back("structures")
+
+    print(str(my_unrolled))
+
+    assert my_unrolled.get_size() == 5
+    assert my_unrolled.get_head().get_data() == ["world", "hello"]
+    assert my_unrolled.get_tail().get_data() == ["structures"]
+    assert my_unrolled.find_element("data").get_data() == ["algorithms", "data"]
+    assert my_unrolled.find_element("woo") == None
+
+    my_unrolled.reverse()
+    assert str(my_unrolled) == (
+        "structures -> data -> algorithms -> hello -> world -> [EOL]"
+    )
+    assert my_unrolled.get_tail().get_data() == ["hello", "world"]
+
+    my_unrolled.insert_block_after(my_unrolled.get_head(), UnrolledNode(["a", "c"]))
+    assert my_unrolled.get_size() == 7
+    my_unrolled.reverse_blocks(my_unrolled.get_head(), 2)
+    assert str(my_unrolled) == (
+        "structures -> algorithms -> data -> c -> a -> hello -> world -> [EOL]"
+    )
+    my_unrolled.reverse_blocks(my_unrolled.get_tail(), 0)  # nothing to reverse
+    assert my_unrolled.get_size() == 7
+    assert my_unrolled.get_tail().get_data() == ["hello", "world"]
+
+    assert my_unrolled.find_and_remove_element("structures") == "structures"
+    assert my_unrolled.find_and_remove_element("woo") == None
+    assert my_unrolled.remove_from_front() == "algorithms"
+    assert my_unrolled.remove_from_back() == "world"
+    assert my_unrolled.remove_from_back() == "hello"
+    assert my_unrolled.get_size() == 3
+    assert str(my_unrolled) == "data -> c -> a -> [EOL]"
+
+    my_unrolled.traverse_and_delete()
+    assert my_unrolled.get_size() == 0
+    assert my_unrolled.get_head() == None
+    assert my_unrolled.get_tail() == None
+
+
 def test_extensible_list():
     """Tests the implementation of the extensible list."""
     print("==== Executing Extensible List Tests ====")
@@ -161,6 +353,618 @@ def test_extensible_list():
     print(str(my_ex_list))
 
 
+def test_extensible_list_extend():
+    """Tests bulk insertion into the extensible list."""
+    print("==== Executing Extensible List Extend Tests ====")
+    my_ex_list = ExtensibleList()
+
+    my_ex_list.extend(["hello", "world"])
+    assert my_ex_list.get_size() == 2
+    assert my_ex_list.get_capacity() == 4
+
+    my_ex_list.extend(range(3))
+    assert my_ex_list.get_size() == 5
+    assert my_ex_list.get_capacity() == 8
+
+    my_ex_list.extend_from_buffer(memoryview(b"gattaca"))
+    assert my_ex_list.get_size() == 12
+    assert my_ex_list.get_capacity() >= 12
+
+    print(str(my_ex_list))
+
+    assert my_ex_list.get_at(0) == "hello"
+    assert my_ex_list.get_at(4) == 2
+    assert my_ex_list.get_at(5) == "g"
+    assert my_ex_list.get_at(11) == "a"
+    assert my_ex_list.get_at(12) == None
+    assert my_ex_list.get_slice(4, 7) == [2, "g", "a"]
+    assert my_ex_list.get_slice(10, 20) == ["c", "a"]
+
+    my_ex_list.extend([])
+    assert my_ex_list.get_size() == 12
+
+    my_ex_list.append("data")
+    assert my_ex_list.get_at(12) == "data"
+
+
+def test_extensible_list_view():
+    """Tests iteration over the extensible list and views of its ranges."""
+    print("==== Executing Extensible List View Tests ====")
+    my_ex_list = ExtensibleList()
+    my_ex_list.extend("gattaca")
+
+    assert len(my_ex_list) == 7
+    assert "".join(my_ex_list) == "gattaca"  # only the cells in use
+
+    my_view = my_ex_list.view(2, 5)
+    assert len(my_view) == 3
+    assert "".join(my_view) == "tta"
+    assert my_view[0] == "t"
+    assert my_view.get_at(3) == None
+
+    my_ex_list.set_at(3, "g")
+    my_ex_list.extend("gattaca" * 4)  # reallocates the list's data
+    assert "".join(my_view) == "tga"  # reads the list, not a copy
+
+    assert "".join(my_ex_list.view(-3, 3)) == "gat"
+    assert "".join(my_ex_list.iter_range(5, 9)) == "caga"
+    assert "".join(my_ex_list.iter_range(30, 50)) == "ttaca"
+    assert len(my_ex_list.view(30, 50)) == 5
+    assert len(my_ex_list.view(50, 40)) == 0
+    assert list(ExtensibleList()) == []
+
+
+def test_extensible_list_growth():
+    """Tests the growth policies and capacity management of the extensible list."""
+    print("==== Executing Extensible List Growth Tests ====")
+    my_ex_list = ExtensibleList(geometric_growth(2))
+
+    for i in range(9):
+        my_ex_list.append(i)
+
+    assert my_ex_list.get_capacity() == 16
+    assert my_ex_list.get_resize_count() == 2
+    assert my_ex_list.get_copy_count() == 4 + 8
+
+    my_ex_list.shrink_to_fit()
+    assert my_ex_list.get_capacity() == 9
+    assert my_ex_list.get_resize_count() == 3
+    assert my_ex_list.get_at(8) == 8
+
+    my_ex_list.reset()
+    my_ex_list.extend(range(5))
+    assert my_ex_list.get_capacity() == 8
+    assert my_ex_list.get_resize_count() == 1
+
+    my_ex_list = ExtensibleList(fixed_chunk_growth(10))
+    my_ex_list.reserve(25)
+    assert my_ex_list.get_capacity() == 25
+    my_ex_list.reserve(3)
+    assert my_ex_list.get_capacity() == 25
+
+    my_ex_list.extend(range(25))
+    assert my_ex_list.get_capacity() == 25
+    my_ex_list.append(25)
+    assert my_ex_list.get_capacity() == 30
+    assert my_ex_list.get_resize_count() == 2
+    assert my_ex_list.get_copy_count() == 25
+
+    print(str(my_ex_list))
+
+
+def test_packed_list():
+    """Tests the implementation of the 2-bit packed list."""
+    print("==== Executing Packed List Tests ====")
+    my_packed = PackedList()
+
+    assert my_packed.is_empty()
+    assert my_packed.get_size() == 0
+    assert my_packed.get_at(0) == None
+
+    my_packed.append("g")
+    my_packed.extend("attacagt")
+
+    print(str(my_packed))
+
+    assert not my_packed.is_empty()
+    assert my_packed.get_size() == 9
+    assert my_packed.get_nbytes() == 3
+    assert str(my_packed) == "gattacagt"
+    assert my_packed.get_at(0) == "g"
+    assert my_packed.get_at(8) == "t"
+    assert my_packed.get_at(9) == None
+    assert my_packed.to_string(3, 7) == "taca"
+
+    my_packed.set_at(0, "c")
+    my_packed.set_at(9, "a")
+    assert str(my_packed) == "cattacagt"
+
+    my_packed.reverse_range(1, 6)
+    assert str(my_packed) == "ccattaagt"
+
+    try:
+        my_packed.append("x")
+        assert False
+    except ValueError:
+        pass
+    assert my_packed.get_size() == 9
+
+    my_other = PackedList()
+    my_other.extend("gat")
+    my_other.extend_packed(my_packed.to_bytes(), my_packed.get_size())
+    assert str(my_other) == "gatccattaagt"
+    my_other.extend_packed(my_other.to_bytes(), 4)
+    assert str(my_other) == "gatccattaagtgatc"
+    assert my_other.get_nbytes() == 4
+
+    my_packed.reset()
+    assert my_packed.is_empty()
+    assert my_packed.get_nbytes() == 0
+
+
+def test_aho_corasick():
+    """Tests multi-pattern matching with the Aho-Corasick automaton."""
+    print("==== Executing Aho-Corasick Tests ====")
+    automaton = AhoCorasick(["gt", "gta", "ta", "c", "gt"])
+
+    assert automaton.get_pattern(1) == "gta"
+    assert automaton.longest_at("cgtag") == [3, 1, 2, -1, -1]
+    assert automaton.leftmost_longest("cgtag") == [(0, 3), (1, 1)]
+    assert automaton.leftmost_longest("gtcgtgta") == [(0, 0), (2, 3), (3, 0), (5, 1)]
+    assert automaton.leftmost_longest("aaaa") == []
+    assert automaton.leftmost_longest("") == []
+
+    print(automaton.leftmost_longest("gattaca"))
+
+
+def test_reachability_index():
+    """Tests right/below reachability queries against a precomputed index."""
+    print("==== Executing Reachability Index Tests ====")
+    index = ReachabilityIndex(["ggtca", "ggcat", "tgggg"])
+
+    assert index.reaches(0, 14)
+    assert index.reaches(0, 0)
+    assert index.reaches(6, 12)
+    assert index.reaches(2, 2)
+    assert index.reaches(5, 12)
+    assert not index.reaches(3, 8)
+    assert not index.reaches(2, 3)
+    assert not index.reaches(14, 0)
+    assert not index.reaches(1, 5)
+    assert not index.reaches(3, 13)
+    assert not index.reaches(0, 15)
+    assert not index.reaches(-1, 0)
+
+    assert not ReachabilityIndex([]).reaches(0, 0)
+    assert ReachabilityIndex(["a"]).reaches(0, 0)
+    assert not ReachabilityIndex(["", ""]).reaches(0, 0)
+    assert not ReachabilityIndex(["ax"]).reaches(1, 1)  # not a base
+
+    # a run that reaches right past a gap above it
+    index = ReachabilityIndex(["aataaa", "caaaat", "aaaaca"])
+    assert index.reaches(0, 15)
+    assert index.reaches(1, 10)
+    assert not index.reaches(0, 17)
+    assert not index.reaches(0, 5)
+    assert not index.reaches(4, 17)
+    assert not read_refgrid("", "extlist").is_viable_between(0, 0)
+
+
+@contextmanager
+def refgrid_file(contents: str) -> Iterator[str]:
+    """Yields the path of a temporary RefGrid file holding contents."""
+    with tempfile.NamedTemporaryFile("w", suffix=".refgrid", delete=False) as f:
+        f.write(contents)
+    try:
+        yield f.name
+    finally:
+        os.remove(f.name)
+
+
+def read_refgrid(contents: str, form: str) -> RefGrid:
+    """Returns a RefGrid read into the given form from a file holding contents."""
+    with refgrid_file(contents) as path:
+        refgrid = RefGrid()
+        getattr(refgrid, "read_to_" + form)(path)
+    return refgrid
+
+
+def test_refgrid_unrolled():
+    """Tests the unrolled RefGrid on empty, short and blank-ended grids."""
+    print("==== Executing RefGrid (unrolled) Tests ====")
+    empty = read_refgrid("", "unrolled")
+    for k in (-1, 0, 1):
+        empty.reverse_seq_unrolled(k)
+    assert list(empty.iter_unrolled_rows()) == []
+
+    short = read_refgrid("acgt\ngtac\n", "unrolled")
+    short.reverse_seq_unrolled(2)
+    short.reverse_seq_unrolled(-1)
+    assert list(short.iter_unrolled_rows()) == ["acgt", "gtac"]
+    short.reverse_seq_unrolled(1)
+    assert list(short.iter_unrolled_rows()) == ["acgt", "catg"]
+
+    blank = read_refgrid("acgt\ngtac\n\n", "unrolled")  # a trailing blank line
+    blank.reverse_seq_unrolled(2)
+    assert list(blank.iter_unrolled_rows()) == ["acgt", "gtac", ""]
+    blank.cut_and_splice_unrolled("gt", 2, "a", 1)
+    assert list(blank.iter_unrolled_rows()) == ["aca", "aac", ""]
+
+
+def test_refgrid_mmap():
+    """Tests mapping RefGrid files, including empty and malformed ones."""
+    print("==== Executing RefGrid (mmap) Tests ====")
+    assert read_refgrid("", "mmap").rows == 0
+    assert read_refgrid("\n\n", "mmap").rows == 2
+    assert list(read_refgrid("acgt\nacgt", "mmap").iter_mmap_rows()) == ["acgt"] * 2
+
+    grid = read_refgrid("acgt\r\ngtac\r\n", "mmap")
+    grid.reverse_seq_mmap(1)
+    grid.reverse_seq_mmap(2)
+    assert list(grid.iter_mmap_rows()) == ["acgt", "catg"]
+
+    for contents in ("acgt\nacg\n", "acgt\nac\nacgt\n"):
+        try:
+            read_refgrid(contents, "mmap")
+            assert False
+        except ValueError:
+            pass
+
+
+def test_refgrid_packed():
+    """Tests splicing the packed RefGrid, including empty grids."""
+    print("==== Executing RefGrid (packed) Tests ====")
+    for contents in ("", "\n"):
+        empty = read_refgrid(contents, "packed")
+        empty.cut_and_splice_packed("a", 1, "cg", 2)
+        assert list(empty.iter_packed_rows()) == [""] * empty.rows
+
+    grid = read_refgrid("gtaca\nacgta\n", "packed")
+    grid.cut_and_splice_packed("gta", 3, "c", 1)
+    assert list(grid.iter_packed_rows()) == ["cca", "acc"]
+
+
+def test_read_cached():
+    """Tests that the binary cache is reused while fresh and rebuilt otherwise."""
+    from execute_refgrid import CACHE_SUFFIX
+
+    print("==== Executing RefGrid Cache Tests ====")
+    iterators = {
+        "linkedlist": RefGrid.iter_rows,
+        "extlist": RefGrid.iter_extlist_rows,
+        "unrolled": RefGrid.iter_unrolled_rows,
+        "packed": RefGrid.iter_packed_rows,
+    }
+
+    def cached_rows(path: str, form: str = "packed") -> list[str]:
+        refgrid = RefGrid()
+        refgrid.read_cached(path, form)
+        return list(iterators[form](refgrid))
+
+    rows = ["acgtacg", "ttgacca", "gggactt"]
+    with refgrid_file("".join(row + "\n" for row in rows)) as path:
+        cache_file = path + CACHE_SUFFIX
+        try:
+            assert cached_rows(path) == rows
+            assert os.path.exists(cache_file)
+            for form in iterators:  # through the cache, as read directly
+                direct = read_refgrid("".join(row + "\n" for row in rows), form)
+                assert cached_rows(path, form) == list(iterators[form](direct))
+
+            # same size and mtime: the old cache is trusted, so it shows the old rows
+            source = os.stat(path)
+            with open(path, "w") as f:
+                f.write("".join(row[::-1] + "\n" for row in rows))
+            os.utime(path, ns=(source.st_atime_ns, source.st_mtime_ns))
+            assert cached_rows(path) == rows
+
+            # a new mtime makes the cache stale
+            os.utime(path, ns=(source.st_atime_ns, source.st_mtime_ns + 10**9))
+            rows = [row[::-1] for row in rows]
+            assert cached_rows(path) == rows
+            with open(cache_file, "rb") as f:
+                cache = f.read()
+
+            flipped = bytearray(cache)
+            flipped[-1] ^= 0xFF
+            for corrupt in (bytes(flipped), cache[:-1], cache[:10], b""):
+                with open(cache_file, "wb") as f:
+                    f.write(corrupt)
+                assert cached_rows(path) == rows
+                with open(cache_file, "rb") as f:
+                    assert f.read() == cache  # rewritten
+        finally:
+            if os.path.exists(cache_file):
+                os.remove(cache_file)
+
+
+def test_write_rows():
+    """Tests writing rows to text and binary sinks in batches."""
+    print("==== Executing Row Writer Tests ====")
+    rows = ["acgt", "", "ttt", "gattaca"]
+    expected = "acgt\n\nttt\ngattaca\n"
+
+    for buffer_size in (1, 6, 1 << 16):
+        text = io.StringIO()
+        write_rows(iter(rows), text, buffer_size)
+        assert text.getvalue() == expected
+
+        binary = io.BytesIO()
+        write_rows(iter(rows), binary, buffer_size)
+        assert binary.getvalue() == expected.encode()
+
+    empty = io.StringIO()
+    write_rows([], empty)
+    assert empty.getvalue() == ""
+
+
+def splice_model(row: str, rules: list[tuple[str, str]]) -> str:
+    """Splices row leftmost-longest, the first of equal patterns winning."""
+    parts = []
+    i = 0
+    while i < len(row):
+        matches = [(p, t) for p, t in rules if row.startswith(p, i)]
+        if len(matches) == 0:
+            parts.append(row[i])
+            i += 1
+            continue
+        pattern, target = max(matches, key=lambda rule: len(rule[0]))
+        parts.append(target)
+        i += len(pattern)
+    return "".join(parts)
+
+
+def test_cut_and_splice_rules():
+    """Tests splicing several rules in one pass against a direct model."""
+    print("==== Executing Multi-Rule Splice Tests ====")
+    rng = random.Random(1)
+    rules = [("gta", "c"), ("gt", "aact"), ("ca", "t"), ("gt", "g")]
+
+    for _ in range(20):
+        length = rng.randint(1, 15)
+        rows = ["".join(rng.choices("acgt", k=length)) for _ in range(6)]
+        refgrid = read_refgrid("".join(row + "\n" for row in rows), "linkedlist")
+        refgrid.cut_and_splice_rules(rules)
+
+        expected = [splice_model(row, rules) for row in rows]
+        assert list(refgrid.iter_rows()) == expected
+        assert [refgrid.row_length(k) for k in range(len(rows))] == [
+            len(row) for row in expected
+        ]
+        assert refgrid.linkedlist.get_size() == sum(len(row) for row in expected)
+
+        refgrid.reverse_seq(3)  # walks from the row index
+        expected[3] = expected[3][::-1]
+        assert list(refgrid.iter_rows()) == expected
+
+
+def test_cut_and_splice_parallel():
+    """Tests that splicing on worker processes matches splicing serially."""
+    from execute_refgrid import _find_partition
+
+    print("==== Executing Parallel Splice Tests ====")
+    assert _find_partition("gacgac\nttt\nacga", "ga") == [(0, [0, 3]), (2, [2])]
+    assert _find_partition("", "ga") == []
+
+    rng = random.Random(0)
+    rows = ["ga" + "".join(rng.choices("acgt", k=10)) + "ga" for _ in range(9)]
+    rows += ["gagagagagagaga", "tttttttttttttt"]
+    contents = "".join(row + "\n" for row in rows)
+
+    for pattern, target in (("ga", "c"), ("ga", "tacg"), ("cgt", "ag"), ("t", "a")):
+        serial = read_refgrid(contents, "linkedlist")
+        serial.cut_and_splice(pattern, len(pattern), target, len(target))
+        parallel = read_refgrid(contents, "linkedlist")
+        parallel.cut_and_splice_parallel(pattern, len(pattern), target, len(target), 2)
+
+        model = [row.replace(pattern, target) for row in rows]
+        assert list(parallel.iter_rows()) == list(serial.iter_rows()) == model
+        assert [parallel.get_row(k) for k in range(len(rows))] == model
+        assert [parallel.row_length(k) for k in range(len(rows))] == [
+            len(row) for row in model
+        ]
+        assert parallel.linkedlist.get_size() == sum(len(row) for row in model)
+        assert parallel.linkedlist.get_tail().get_data() == model[-1][-1]
+
+        for k in range(len(rows)):  # walks each row from its row index entry
+            parallel.reverse_seq(k)
+        assert list(parallel.iter_rows()) == [row[::-1] for row in model]
+
+
+def test_pipeline():
+    """Tests a pipeline that switches between forms against a str.replace model."""
+    print("==== Executing Pipeline Tests ====")
+    rng = random.Random(0)
+    rows = ["".join(rng.choices("acgt", k=12)) for _ in range(6)]
+
+    model = [row.replace("gt", "ac") for row in rows]
+    model[2] = model[2][::-1]
+    viable = read_refgrid("".join(row + "\n" for row in model), "extlist").is_viable()
+    model = [row.replace("a", "gct") for row in model]
+    model[0] = model[0][::-1]
+
+    out = io.StringIO()
+    steps = parse_pipeline("splice:gt:ac,reverse:2,check-clone,splice:a:gct,reverse:0")
+    with refgrid_file("".join(row + "\n" for row in rows)) as path:
+        run_pipeline(RefGrid(), path, steps, out)
+    assert out.getvalue() == (
+        "Testing cut-and-splice with P = gt and T = ac\n"
+        "Testing reverse k with k = 2\n"
+        f"Testing viability via L-Path: {viable}\n"
+        "Testing cut-and-splice with P = a and T = gct\n"
+        "Testing reverse k with k = 0\n" + "".join(row + "\n" for row in model)
+    )
+
+    for contents in ("", "\n"):
+        out = io.StringIO()
+        with refgrid_file(contents) as path:
+            run_pipeline(RefGrid(), path, parse_pipeline("check-clone,reverse:0"), out)
+        assert out.getvalue() == (
+            "Testing viability via L-Path: False\n"
+            "Testing reverse k with k = 0\n" + contents
+        )
+
+
+def test_batch_run_file():
+    """Tests that batch reports capture each file's output or error."""
+    import batch_refgrid
+
+    print("==== Executing Batch Runner Tests ====")
+    steps = parse_pipeline("reverse:0")
+    with refgrid_file("acgt\nttag\n") as path:
+        report = batch_refgrid.run_file(path, steps)
+        assert report["refgrid"] == path
+        assert report["output"] == "Testing reverse k with k = 0\ntgca\nttag\n"
+        assert "error" not in report and "error_type" not in report
+
+        def failing_pipeline(refgrid, input_file, steps, out):
+            print("partial", file=out)
+            raise RuntimeError("worker failed")
+
+        run_pipeline = batch_refgrid.run_pipeline
+        batch_refgrid.run_pipeline = failing_pipeline
+        try:
+            report = batch_refgrid.run_file(path, steps)
+        finally:
+            batch_refgrid.run_pipeline = run_pipeline
+        assert report["output"] == "partial\n"
+        assert report["error"] == "worker failed"
+        assert report["error_type"] == "RuntimeError"
+
+        missing = path + ".missing"
+        report = batch_refgrid.run_file(missing, steps)
+        assert report["refgrid"] == missing and report["output"] == ""
+        assert report["error_type"] == "FileNotFoundError"
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("b.refgrid", "a.refgrid", "c.txt"):
+            open(os.path.join(directory, name), "w").close()
+        a, b = (os.path.join(directory, n) for n in ("a.refgrid", "b.refgrid"))
+        assert batch_refgrid.find_refgrids([directory]) == [a, b]
+        pattern = os.path.join(directory, "*.ref*")
+        assert batch_refgrid.find_refgrids([pattern]) == [a, b]
+        assert batch_refgrid.find_refgrids([b, "x.refgrid"]) == [b, "x.refgrid"]
+
+
+def test_refgrid_numpy():
+    """Tests the NumPy viability engine against the depth-first search."""
+    from generate_refgrid import generate
+
+    print("==== Executing RefGrid (NumPy) Tests ====")
+    try:
+        import numpy
+    except ImportError:
+        print("NumPy is not installed; skipping")
+        return
+
+    for seed in range(20):
+        for rows, length in ((1, 1), (1, 7), (6, 1), (8, 9), (30, 20)):
+            for viable in (True, False, None):
+                if viable is False and rows * length < 2:
+                    continue
+                grid = generate(rows, length, seed, [4, 1, 1, 1], viable=viable)
+                refgrid = read_refgrid("".join(row + "\n" for row in grid), "extlist")
+                assert refgrid.is_viable_numpy() == refgrid.is_viable()
+
+    assert read_refgrid("", "extlist").is_viable_numpy() == False
+
+
+def test_generate_refgrid():
+    """Tests that generated grids are seeded and as viable as asked."""
+    from generate_refgrid import generate
+
+    print("==== Executing RefGrid Generator Tests ====")
+    assert generate(5, 8, seed=3) == generate(5, 8, seed=3)
+    assert generate(5, 8, seed=3) != generate(5, 8, seed=4)
+
+    for seed in range(20):
+        for rows, length in ((1, 2), (2, 1), (1, 7), (6, 1), (8, 9)):
+            for viable in (True, False):
+                grid = generate(rows, length, seed, [4, 1, 1, 1], viable=viable)
+                refgrid = read_refgrid("".join(row + "\n" for row in grid), "extlist")
+                assert refgrid.is_viable() == viable
+
+    assert generate(1, 1, viable=True) in (["a"], ["c"], ["g"], ["t"])
+    try:
+        generate(1, 1, viable=False)  # the first cell is the last
+        assert False
+    except ValueError:
+        pass
+
+
+def test_stats():
+    """Tests counting the work done inside the structures."""
+    print("==== Executing Stats Tests ====")
+    my_list = SingleLinkedList()
+    for i in range(5):
+        my_list.insert_to_back(SingleNode(i))
+
+    my_list.find_element(3)
+    assert STATS.get_counts() == {}  # off by default
+
+    with STATS.counting() as outer:
+        my_stack = EStack()
+        for i in range(5):
+            my_stack.push(i + 1)
+        my_stack.pop()
+
+        with STATS.counting() as inner:
+            my_list.find_element(3)
+            my_list.find_element(9)
+            my_list.reverse_after(None, 10)
+
+    print(outer)
+
+    assert inner == {"linkedlist.walked": 9, "linkedlist.reversed": 5}
+    assert outer["linkedlist.walked"] == 9
+    assert outer["estack.push"] == 5
+    assert outer["estack.pop"] == 1
+    assert outer["extlist.resize"] == 1
+    assert outer["extlist.copy"] == 4
+
+    with STATS.counting() as removal:
+        my_list.find_and_remove_element(2)  # the third node, now reversed
+        my_list.find_and_remove_element(9)
+    assert removal == {"linkedlist.walked": 7}
+    assert not STATS.on
+    assert STATS.get_counts() == {}
+
+
+def test_int_stack():
+    """Tests the implementation of the array-backed integer stack."""
+    print("==== Executing Stack (array) Tests ====")
+    my_stack = IStack()
+
+    assert my_stack.empty()
+    assert my_stack.pop() == None
+    assert my_stack.peek() == None
+
+    for i in range(10):
+        my_stack.push(i)
+    my_stack.push_many([10, 11, 12])
+
+    print(str(my_stack))
+
+    assert my_stack.get_size() == 13
+    assert my_stack.get_capacity() == 16
+    assert my_stack.peek() == 12
+    assert str(my_stack).startswith("[> 12 <], 11, 10, 9")
+
+    for i in range(12, 2, -1):
+        assert my_stack.pop() == i
+    assert my_stack.get_size() == 3
+    assert my_stack.get_capacity() == 8  # shrinks once under a quarter full
+
+    my_stack.push(-(1 << 62))
+    assert my_stack.pop() == -(1 << 62)
+
+    my_stack.reserve(32)
+    assert my_stack.get_capacity() == 32
+    while not my_stack.empty():
+        my_stack.pop()
+    assert my_stack.get_capacity() == 32  # never below the reserved capacity
+
+
 def test_ex_stack():
     """Tests the implementation of the extensible list-based stack."""
     print("==== Executing Stack (ExtensibleList) Tests ====")
@@ -210,11 +1014,41 @@ if __name__ == "__main__":
         action="store_true",
         help="Run linked list tests?",
     )
+    parser.add_argument(
+        "--unrolled-list",
+        action="store_true",
+        help="Run unrolled linked list tests?",
+    )
     parser.add_argument(
         "--ex-list",
         action="store_true",
         help="Run extensible list tests?",
     )
+    parser.add_argument(
+        "--packed-list",
+        action="store_true",
+        help="Run packed list tests?",
+    )
+    parser.add_argument(
+        "--aho-corasick",
+        action="store_true",
+        help="Run Aho-Corasick automaton tests?",
+    )
+    parser.add_argument(
+        "--reachability",
+        action="store_true",
+        help="Run reachability index tests?",
+    )
+    parser.add_argument(
+        "--refgrid",
+        action="store_true",
+        help="Run RefGrid backend tests?",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Run stats counting tests?",
+    )
     parser.add_argument(
         "--linked-stack",
         action="store_true",
@@ -225,6 +1059,11 @@ if __name__ == "__main__":
         action="store_true",
         help="Run stack (extensible list) tests?",
     )
+    parser.add_argument(
+        "--int-stack",
+        action="store_true",
+        help="Run stack (array) tests?",
+    )
     parser.add_argument(
         "--bench-stacks",
         type=int,
@@ -240,11 +1079,42 @@ if __name__ == "__main__":
 
     if args.linked_list:
         test_single_linked_list()
+        test_single_linked_list_tail()
+        test_single_linked_list_reverse_after()
+        test_single_linked_list_view()
+        test_node_pool()
+    if args.unrolled_list:
+        test_unrolled_linked_list()
     if args.ex_list:
         test_extensible_list()
+        test_extensible_list_extend()
+        test_extensible_list_view()
+        test_extensible_list_growth()
+    if args.packed_list:
+        test_packed_list()
+    if args.aho_corasick:
+        test_aho_corasick()
+    if args.reachability:
+        test_reachability_index()
+    if args.refgrid:
+        test_refgrid_unrolled()
+        test_refgrid_mmap()
+        test_refgrid_packed()
+        test_read_cached()
+        test_write_rows()
+        test_cut_and_splice_rules()
+        test_cut_and_splice_parallel()
+        test_pipeline()
+        test_batch_run_file()
+        test_refgrid_numpy()
+        test_generate_refgrid()
+    if args.stats:
+        test_stats()
     if args.linked_stack:
         test_linked_stack()
     if args.ex_stack:
         test_ex_stack()
+    if args.int_stack:
+        test_int_stack()
     if args.bench_stacks is not None:
         benchmark_stacks(args.bench_stacks)